@@ -0,0 +1,44 @@
+"""Per-callable caching for FastAPI dependency introspection."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from fastapi.dependencies import utils as dependency_utils
+
+# Predicates that `solve_dependencies` re-evaluates for every dependency on every request.
+_PER_REQUEST_PREDICATES = (
+    "is_coroutine_callable",
+    "is_async_gen_callable",
+    "is_gen_callable",
+)
+
+
+def install_dependency_inspection_cache() -> None:
+    """Memoize FastAPI callable-kind checks; dependency callables never change at runtime."""
+    for name in _PER_REQUEST_PREDICATES:
+        predicate = getattr(dependency_utils, name)
+        if getattr(predicate, "__wrapped__", None) is not None:
+            continue
+        setattr(dependency_utils, name, _cached_predicate(predicate))
+
+
+def _cached_predicate(predicate: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    cache: WeakKeyDictionary[Any, bool] = WeakKeyDictionary()
+
+    def cached(call: Any) -> bool:
+        try:
+            return cache[call]
+        except KeyError:
+            pass
+        except TypeError:
+            # Callable is not weak-referenceable (or unhashable): inspect every time.
+            return predicate(call)
+        result = predicate(call)
+        cache[call] = result
+        return result
+
+    cached.__wrapped__ = predicate  # type: ignore[attr-defined]
+    return cached
@@ -1,51 +1,73 @@
 """FastAPI dependencies."""
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.rag.generator import RAGService
 from app.services.auth_service import AuthService, AuthUser
 from app.services.container import ServiceContainer
 from app.services.document_service import DocumentService
+from app.services.token_cache import TokenCache
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Bound once at startup; the container is immutable afterwards.
+_rag_service: RAGService | None = None
+_document_service: DocumentService | None = None
+_auth_service: AuthService | None = None
+_token_cache: TokenCache | None = None
 
-def get_container(request: Request) -> ServiceContainer:
-    """Return application-level service container."""
-    return request.app.state.container
 
+def bind_services(container: ServiceContainer) -> None:
+    """Expose container services to request-time dependency providers."""
+    global _rag_service, _document_service, _auth_service, _token_cache
+    _rag_service = container.rag_service
+    _document_service = container.document_service
+    _auth_service = container.auth_service
+    _token_cache = container.token_cache
 
-def get_rag_service(request: Request) -> RAGService:
+
+async def get_rag_service() -> RAGService:
     """Provide RAG service dependency."""
-    return get_container(request).rag_service
+    return _rag_service  # type: ignore[return-value]
 
 
-def get_document_service(request: Request) -> DocumentService:
+async def get_document_service() -> DocumentService:
     """Provide document service dependency."""
-    return get_container(request).document_service
+    return _document_service  # type: ignore[return-value]
 
 
-def get_auth_service(request: Request) -> AuthService:
+async def get_auth_service() -> AuthService:
     """Provide auth service dependency."""
-    return get_container(request).auth_service
+    return _auth_service  # type: ignore[return-value]
+
+
+async def get_token_cache() -> TokenCache:
+    """Provide bearer-token session cache dependency."""
+    return _token_cache  # type: ignore[return-value]
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     auth_service: AuthService = Depends(get_auth_service),
+    token_cache: TokenCache = Depends(get_token_cache),
 ) -> AuthUser:
     """Validate bearer token and return current user."""
-    if credentials is None or credentials.scheme.lower() != "bearer":
+    if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization required",
         )
 
+    user = await token_cache.get(credentials.credentials)
+    if user is not None:
+        return user
+
     user = await auth_service.get_user_by_token(credentials.credentials)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired session",
         )
+    await token_cache.set(credentials.credentials, user)
     return user
@@ -3,25 +3,51 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Callable
 
 import structlog
-from fastapi import Request, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger(__name__)
 
 
-async def logging_middleware(request: Request, call_next: Callable) -> Response:
-    """Log request timing in structured JSON format."""
-    started = time.perf_counter()
-    response = await call_next(request)
-    elapsed_ms = int((time.perf_counter() - started) * 1000)
-    logger.info(
-        "http_request",
-        method=request.method,
-        path=request.url.path,
-        status_code=response.status_code,
-        processing_time_ms=elapsed_ms,
-    )
-    response.headers["X-Processing-Time-Ms"] = str(elapsed_ms)
-    return response
+class TimingMiddleware:
+    """Log request timing in structured JSON format.
+
+    Plain ASGI middleware: only ``send`` is wrapped, so no Request/Response
+    objects are built per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter_ns()
+        # Unhandled errors propagate before a response starts; ServerErrorMiddleware answers 500.
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter_ns() - started) // 1_000_000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-processing-time-ms", str(elapsed_ms).encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # Logged once the body is fully sent, so streamed responses report their full duration.
+            logger.info(
+                "http_request",
+                method=scope["method"],
+                path=scope["path"],
+                status_code=status_code,
+                processing_time_ms=(time.perf_counter_ns() - started) // 1_000_000,
+            )
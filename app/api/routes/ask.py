@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import logging
+from collections.abc import AsyncIterator
+
+import orjson
 import structlog
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import get_current_user, get_rag_service
+from app.core.exceptions import AppError
 from app.models.schemas import AskRequest, AskResponse
 from app.rag.generator import RAGService
 from app.services.auth_service import AuthUser
@@ -28,6 +34,59 @@ async def ask_question(
         mode=payload.mode,
         document_names=payload.document_names,
     )
+    _log_ask_request(payload=payload, response=response, user=current_user)
+    return response
+
+
+@router.post("/ask/stream")
+async def ask_question_stream(
+    payload: AskRequest,
+    rag_service: RAGService = Depends(get_rag_service),
+    current_user: AuthUser = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream answer as server-sent events: `delta` text pieces, then `done` with the full response."""
+    return StreamingResponse(
+        _ask_events(payload=payload, rag_service=rag_service, user=current_user),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _ask_events(
+    payload: AskRequest,
+    rag_service: RAGService,
+    user: AuthUser,
+) -> AsyncIterator[bytes]:
+    try:
+        async for event in rag_service.ask_stream(
+            question=payload.question,
+            query_type=payload.type,
+            version=payload.version,
+            mode=payload.mode,
+            document_names=payload.document_names,
+        ):
+            if isinstance(event, AskResponse):
+                _log_ask_request(payload=payload, response=event, user=user)
+                yield _sse_event("done", event.model_dump_json().encode("utf-8"))
+            else:
+                yield _sse_event("delta", orjson.dumps({"text": event}))
+    except AppError as exc:
+        # Headers are already sent, so errors are reported in-band.
+        yield _sse_event("error", orjson.dumps({"detail": str(exc)}))
+    except Exception as exc:  # noqa: BLE001
+        # Mirrors the app-wide 500 handler: log details, keep them out of the client stream.
+        logger.exception("ask_stream_failed", error=str(exc))
+        yield _sse_event("error", orjson.dumps({"detail": "Internal server error"}))
+
+
+def _sse_event(name: str, data: bytes) -> bytes:
+    return b"event: " + name.encode("ascii") + b"\ndata: " + data + b"\n\n"
+
+
+def _log_ask_request(payload: AskRequest, response: AskResponse, user: AuthUser) -> None:
+    # Checked per call: the logging level is configured after this module is imported.
+    if not logger.is_enabled_for(logging.INFO):
+        return
     logger.info(
         "ask_request",
         question=payload.question,
@@ -38,6 +97,5 @@ async def ask_question(
         processing_time_ms=response.processing_time_ms,
         input_tokens=response.token_usage.input_tokens,
         output_tokens=response.token_usage.output_tokens,
-        user_id=current_user.id,
+        user_id=user.id,
     )
-    return response
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import orjson
+from cachetools import LRUCache
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
 
-from app.api.deps import bearer_scheme, get_auth_service, get_current_user
+from app.api.deps import bearer_scheme, get_auth_service, get_current_user, get_token_cache
 from app.models.schemas import (
     AuthResponse,
     LoginRequest,
@@ -14,11 +16,29 @@ from app.models.schemas import (
     UserProfile,
 )
 from app.services.auth_service import AuthService, AuthUser
+from app.services.token_cache import TokenCache
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Validated profiles keyed by every field they are built from, so updated users never hit stale entries.
+_profile_cache: LRUCache[tuple, UserProfile] = LRUCache(maxsize=2048)
+
 
 def _to_user_profile(user: AuthUser) -> UserProfile:
+    try:
+        settings_key = orjson.dumps(user.settings, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return _build_user_profile(user)
+
+    key = (user.id, user.email, user.display_name, settings_key, user.created_at)
+    profile = _profile_cache.get(key)
+    if profile is None:
+        profile = _build_user_profile(user)
+        _profile_cache[key] = profile
+    return profile
+
+
+def _build_user_profile(user: AuthUser) -> UserProfile:
     return UserProfile(
         id=user.id,
         email=user.email,
@@ -49,12 +69,15 @@ async def register(
 async def login(
     payload: LoginRequest,
     auth_service: AuthService = Depends(get_auth_service),
+    token_cache: TokenCache = Depends(get_token_cache),
 ) -> AuthResponse:
     """Log in and return session token."""
     try:
         token, user = await auth_service.login(email=payload.email, password=payload.password)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
+    # Login replaces previous sessions of this user.
+    await token_cache.invalidate_user(user.id)
     return AuthResponse(access_token=token, user=_to_user_profile(user))
 
 
@@ -62,10 +85,12 @@ async def login(
 async def logout(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     auth_service: AuthService = Depends(get_auth_service),
+    token_cache: TokenCache = Depends(get_token_cache),
 ) -> dict[str, str]:
     """Invalidate current session token."""
-    if credentials is not None and credentials.scheme.lower() == "bearer":
+    if credentials is not None:
         await auth_service.logout(credentials.credentials)
+        await token_cache.pop(credentials.credentials)
     return {"status": "ok"}
 
 
@@ -80,6 +105,7 @@ async def update_me(
     payload: UpdateProfileRequest,
     current_user: AuthUser = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service),
+    token_cache: TokenCache = Depends(get_token_cache),
 ) -> UserProfile:
     """Update user profile/settings."""
     try:
@@ -90,4 +116,5 @@ async def update_me(
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    await token_cache.invalidate_user(current_user.id)
     return _to_user_profile(user)
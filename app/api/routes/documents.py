@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-import tempfile
 from pathlib import Path
 
 import structlog
@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, s
 from pydantic import BaseModel
 
 from app.api.deps import get_current_user, get_document_service
+from app.config.settings import get_settings
 from app.core.exceptions import IngestionError, UnsupportedFileTypeError
 from app.models.schemas import UploadResponse
 from app.services.document_service import DocumentService
@@ -19,6 +20,8 @@ from app.services.auth_service import AuthUser
 router = APIRouter(prefix="/documents", tags=["documents"])
 logger = structlog.get_logger(__name__)
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 
 class SoftDeleteRequest(BaseModel):
     """Payload for soft-deleting indexed versions."""
@@ -48,22 +51,28 @@ async def upload_document(
             detail="Unsupported file type. Allowed: pdf, docx, xlsx",
         )
 
-    temp_file = None
+    max_size_mb = get_settings().uploaded_file_max_size_mb
+    max_size_bytes = max_size_mb * 1024 * 1024
+    stored_path = document_service.build_storage_path(file.filename or f"unnamed{suffix}")
+    partial_file = stored_path.with_name(f"{stored_path.name}.partial")
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            temp_file = Path(tmp.name)
-            content = await file.read()
-            if not content:
+        with partial_file.open("wb") as target:
+            total_size = 0
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                total_size += len(chunk)
+                if total_size > max_size_bytes:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Uploaded file exceeds {max_size_mb} MB limit",
+                    )
+                await asyncio.to_thread(target.write, chunk)
+            if total_size == 0:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Uploaded file is empty",
                 )
-            tmp.write(content)
+        os.replace(partial_file, stored_path)
 
-        stored_path = document_service.persist_temp_file(
-            temp_path=temp_file,
-            filename=file.filename or f"unnamed{suffix}",
-        )
         result = await document_service.ingest_file(
             source_file=stored_path,
             original_name=file.filename or stored_path.name,
@@ -81,8 +90,8 @@ async def upload_document(
         logger.error("upload_failed", error=str(exc))
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     finally:
-        if temp_file and temp_file.exists():
-            os.unlink(temp_file)
+        if partial_file.exists():
+            os.unlink(partial_file)
 
 
 @router.post("/soft-delete", response_model=SoftDeleteResponse)
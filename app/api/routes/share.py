@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
 
 from app.api.deps import get_auth_service, get_current_user
 from app.models.schemas import CreateShareRequest, CreateShareResponse, SharedChatResponse
@@ -10,6 +11,9 @@ from app.services.auth_service import AuthService, AuthUser
 
 router = APIRouter(prefix="/share", tags=["share"])
 
+# Serializes validated messages straight to JSON without an intermediate list of dicts.
+_messages_adapter = TypeAdapter(CreateShareRequest.model_fields["messages"].annotation)
+
 
 @router.post("", response_model=CreateShareResponse)
 async def create_share(
@@ -22,7 +26,7 @@ async def create_share(
     token = await auth_service.create_share(
         user_id=current_user.id,
         title=payload.title,
-        messages=[message.model_dump() for message in payload.messages],
+        messages_json=_messages_adapter.dump_json(payload.messages).decode("utf-8"),
     )
     base_url = str(request.base_url).rstrip("/")
     return CreateShareResponse(token=token, share_url=f"{base_url}/?share={token}")
@@ -1,16 +1,76 @@
 """Web UI route."""
 
+import hashlib
+import mimetypes
+from email.utils import formatdate
 from pathlib import Path
+from typing import NamedTuple
 
-from fastapi import APIRouter
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Request, Response
+from starlette.datastructures import Headers
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
 
 router = APIRouter(tags=["web"])
 BASE_DIR = Path(__file__).resolve().parents[2]
 WEB_DIR = BASE_DIR / "web"
 
+ASSETS_DIR = WEB_DIR / "assets"
+INDEX_PATH = WEB_DIR / "index.html"
+INDEX_BYTES = INDEX_PATH.read_bytes()
+INDEX_ETAG = f'"{hashlib.blake2b(INDEX_BYTES, digest_size=8).hexdigest()}"'
+INDEX_HEADERS = {
+    "ETag": INDEX_ETAG,
+    "Last-Modified": formatdate(INDEX_PATH.stat().st_mtime, usegmt=True),
+    "Cache-Control": "no-cache",
+}
+
 
 @router.get("/", include_in_schema=False)
-async def index_page() -> FileResponse:
+async def index_page(request: Request) -> Response:
     """Serve single-page web UI."""
-    return FileResponse(WEB_DIR / "index.html")
+    if request.headers.get("if-none-match") == INDEX_ETAG:
+        return Response(status_code=304, headers=INDEX_HEADERS)
+    return Response(content=INDEX_BYTES, media_type="text/html", headers=INDEX_HEADERS)
+
+
+class _Asset(NamedTuple):
+    body: bytes
+    media_type: str
+    headers: dict[str, str]
+
+
+class AssetFiles(StaticFiles):
+    """Static assets served from an in-memory snapshot with ETag revalidation.
+
+    Files that appear after startup fall through to regular StaticFiles lookup.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        super().__init__(directory=str(directory))
+        self._assets = _load_assets(directory)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        asset = self._assets.get(path)
+        if asset is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+        if Headers(scope=scope).get("if-none-match") == asset.headers["ETag"]:
+            return Response(status_code=304, headers=asset.headers)
+        return Response(content=asset.body, media_type=asset.media_type, headers=asset.headers)
+
+
+def _load_assets(directory: Path) -> dict[str, _Asset]:
+    assets: dict[str, _Asset] = {}
+    for path in directory.rglob("*"):
+        if not path.is_file():
+            continue
+        body = path.read_bytes()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        # Asset URLs are not fingerprinted, so clients must revalidate instead of caching blindly.
+        headers = {
+            "ETag": f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"',
+            "Last-Modified": formatdate(path.stat().st_mtime, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+        assets[str(path.relative_to(directory))] = _Asset(body, media_type, headers)
+    return assets
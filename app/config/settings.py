@@ -1,6 +1,5 @@
 """Application settings loaded from environment variables."""
 
-from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field, model_validator
@@ -31,17 +30,28 @@ class Settings(BaseSettings):
     qdrant_api_key: str | None = None
     qdrant_collection: str = "knowledge_base"
     qdrant_timeout_sec: int = 10
+    qdrant_search_batch_size: int = 16
+    qdrant_search_batch_wait_ms: int = 0
+    qdrant_hnsw_ef: int | None = None
+    qdrant_prefer_grpc: bool = True
+    qdrant_grpc_port: int = 6334
 
     embedding_model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
     embedding_batch_size: int = 32
     embedding_cache_size: int = 4096
     embedding_retry_attempts: int = 3
+    embedding_max_concurrency: int = 1
+    query_embedding_batch_size: int = 16
+    query_embedding_batch_wait_ms: int = 5
 
     chunk_size_words: int = 220
     chunk_overlap_words: int = 40
+    ingest_batch_size: int = 64
+    pdf_parse_workers: int = 2
 
     retrieval_top_k: int = 8
     retrieval_candidate_k: int = 24
+    retrieval_speculative_fallback: bool = False
     similarity_threshold: float = 0.2
     reranker_semantic_weight: float = 0.6
     reranker_lexical_weight: float = 0.3
@@ -54,6 +64,9 @@ class Settings(BaseSettings):
     llm_temperature: float = 0.0
     llm_max_tokens: int = 500
     llm_timeout_sec: int = 30
+    llm_preload: bool = True
+    llm_response_cache_size: int = 512
+    llm_response_cache_ttl_sec: int = 3600
 
     openai_api_key: str | None = None
     openai_base_url: str | None = None
@@ -63,11 +76,18 @@ class Settings(BaseSettings):
     local_model_filename: str = "Qwen2.5-7B-Instruct-Q4_K_M.gguf"
     local_model_context_size: int = 4096
     local_model_threads: int = 8
+    local_model_queue_size: int = 32
+    local_model_gpu_layers: int = -1
+    local_model_flash_attn: bool = True
+    local_model_batch_size: int = 512
+    local_model_ubatch_size: int = 256
 
     document_storage_path: Path = Field(default=BASE_DIR / "data" / "documents")
     app_db_path: Path = Field(default=BASE_DIR / "data" / "app.db")
     uploaded_file_max_size_mb: int = 50
     auth_session_ttl_hours: int = 168
+    auth_token_cache_size: int = 8192
+    auth_token_cache_ttl_sec: int = 60
 
     market_intel_enabled: bool = True
     market_intel_timeout_sec: int = 8
@@ -87,7 +107,12 @@ class Settings(BaseSettings):
         return self
 
 
-@lru_cache(maxsize=1)
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
     """Return singleton settings instance."""
-    return Settings()
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
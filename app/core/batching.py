@@ -0,0 +1,89 @@
+"""Micro-batching of concurrent single-item async requests."""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+class MicroBatcher(ABC, Generic[ItemT, ResultT]):
+    """Coalesce concurrent ``submit`` calls into one ``_process`` call per batch.
+
+    After the first queued item a batch waits ``max_wait_ms`` for company, then
+    takes up to ``max_batch`` items. Items queued while a batch is processed
+    join the next one.
+    """
+
+    def __init__(self, max_batch: int = 16, max_wait_ms: int = 5) -> None:
+        self._max_batch = max(1, max_batch)
+        self._max_wait_sec = max(0, max_wait_ms) / 1000
+        self._queue: asyncio.Queue[tuple[ItemT, asyncio.Future[ResultT]]] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    async def submit(self, item: ItemT) -> ResultT:
+        """Return result for item, processed together with other in-flight items."""
+        loop = asyncio.get_running_loop()
+        worker = self._worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            # Queue and worker are bound to the running loop; rebuild them if it changed.
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run(self._queue))
+        future: asyncio.Future[ResultT] = loop.create_future()
+        self._queue.put_nowait((item, future))  # type: ignore[union-attr]
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the worker; callers still waiting on it get CancelledError."""
+        worker, queue = self._worker, self._queue
+        self._worker = self._queue = None
+        # A worker left behind by a finished loop is already gone with that loop.
+        if worker is None or worker.get_loop() is not asyncio.get_running_loop():
+            return
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+        while queue is not None and not queue.empty():
+            _, future = queue.get_nowait()
+            future.cancel()
+
+    @abstractmethod
+    async def _process(self, items: list[ItemT]) -> list[ResultT]:
+        """Return one result per item, in item order."""
+
+    async def _run(self, queue: asyncio.Queue[tuple[ItemT, asyncio.Future[ResultT]]]) -> None:
+        while True:
+            batch = [await queue.get()]
+            try:
+                if self._max_wait_sec:
+                    await asyncio.sleep(self._max_wait_sec)
+                while len(batch) < self._max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+                await self._process_batch(batch)
+            except asyncio.CancelledError:
+                # Closed mid-batch: release callers instead of leaving them waiting forever.
+                for _, future in batch:
+                    future.cancel()
+                raise
+
+    async def _process_batch(self, batch: list[tuple[ItemT, asyncio.Future[ResultT]]]) -> None:
+        # Callers that were cancelled while queued are not worth processing.
+        pending = [(item, future) for item, future in batch if not future.done()]
+        if not pending:
+            return
+        try:
+            results = await self._process([item for item, _ in pending])
+            resolved = list(zip(pending, results, strict=True))
+        except Exception as exc:  # noqa: BLE001
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in resolved:
+            if not future.done():
+                future.set_result(result)
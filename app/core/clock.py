@@ -0,0 +1,32 @@
+"""Cheap wall-clock timestamps for response payloads."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+
+from app.core.constants import UTC_TIMEZONE
+
+# (epoch second, aware datetime, ISO string); replaced as one tuple so readers never see a torn entry.
+_cached: tuple[int, datetime, str] | None = None
+
+
+def utc_now() -> datetime:
+    """Return current UTC time truncated to whole seconds, reused within the second."""
+    return _current()[1]
+
+
+def utc_now_iso() -> str:
+    """Return ISO-8601 form of ``utc_now()`` without re-formatting it per call."""
+    return _current()[2]
+
+
+def _current() -> tuple[int, datetime, str]:
+    global _cached
+    second = int(time.time())
+    cached = _cached
+    if cached is None or cached[0] != second:
+        moment = datetime.fromtimestamp(second, tz=UTC_TIMEZONE)
+        cached = (second, moment, moment.isoformat())
+        _cached = cached
+    return cached
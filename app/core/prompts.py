@@ -14,13 +14,16 @@ Hard constraints:
 5. Keep the language consistent with the user's question.
 """
 
-USER_PROMPT_TEMPLATE = """
+# Appended to SYSTEM_PROMPT; must not reference per-request inputs.
+RESPONSE_FRAMING_TEMPLATE = """
 Query type: {query_type}
 Response mode: {response_mode}
 
 Mode guidance:
 {mode_instruction}
+"""
 
+USER_PROMPT_TEMPLATE = """
 Question profile:
 {question_profile}
 
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import re
 
+# Unicode-aware \s already covers non-breaking spaces (U+00A0).
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def clean_text(value: str) -> str:
     """Normalize whitespace and trim noisy fragments."""
-    normalized = re.sub(r"\s+", " ", value or "").strip()
-    return normalized
+    return WHITESPACE_PATTERN.sub(" ", value or "").strip()
 
 
 def normalize_table_rows(rows: list[list[str | None]]) -> str:
@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 
 import fitz
 import pandas as pd
-import pdfplumber
 from docx import Document
 from docx.document import Document as DocxDocument
 from docx.oxml.table import CT_Tbl
 from docx.oxml.text.paragraph import CT_P
 from docx.table import Table
 from docx.text.paragraph import Paragraph
+from lxml import etree
 
 from app.core.exceptions import IngestionError, UnsupportedFileTypeError
-from app.ingestion.normalizer import clean_text, normalize_table_rows
+from app.ingestion.normalizer import WHITESPACE_PATTERN, clean_text, normalize_table_rows
+
+# Smaller PDFs are parsed in-process: worker start-up would cost more than it saves.
+PDF_PARALLEL_MIN_PAGES = 16
+PDF_PAGES_PER_TASK = 8
+
+_PAGE_BREAK_XPATH = etree.XPath(
+    './/w:br[@w:type="page"] | .//w:lastRenderedPageBreak',
+    namespaces={"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"},
+)
+
+# (1-based page number, cleaned page text, normalized non-empty table texts)
+_PdfPage = tuple[int, str, list[str]]
 
 
 @dataclass(slots=True)
@@ -34,6 +51,19 @@ class DocumentParser:
 
     SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".xlsx"}
 
+    def __init__(self, pdf_workers: int = 2) -> None:
+        self._pdf_workers = max(1, pdf_workers)
+        # Spawned lazily on the first large PDF and reused: each worker re-imports fitz, pandas and docx.
+        self._pdf_executor: ProcessPoolExecutor | None = None
+        self._pdf_executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down PDF worker processes, if any were started."""
+        with self._pdf_executor_lock:
+            executor, self._pdf_executor = self._pdf_executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
     def parse(self, file_path: Path) -> list[ParsedElement]:
         """Dispatch parser by extension."""
         extension = file_path.suffix.lower()
@@ -47,13 +77,15 @@ class DocumentParser:
         return self._parse_xlsx(file_path)
 
     def _parse_pdf(self, file_path: Path) -> list[ParsedElement]:
-        elements: list[ParsedElement] = []
+        text_elements: list[ParsedElement] = []
+        table_elements: list[ParsedElement] = []
         try:
-            pdf_doc = fitz.open(file_path)
-            for page_index, page in enumerate(pdf_doc, start=1):
-                text = clean_text(page.get_text("text"))
+            with fitz.open(file_path) as pdf_doc:
+                page_count = pdf_doc.page_count
+
+            for page_index, text, table_texts in self._extract_pdf_pages(file_path, page_count):
                 if text:
-                    elements.append(
+                    text_elements.append(
                         ParsedElement(
                             text=text,
                             page_number=page_index,
@@ -61,27 +93,50 @@ class DocumentParser:
                             element_type="text",
                         )
                     )
-
-            with pdfplumber.open(file_path) as plumber_pdf:
-                for page_index, page in enumerate(plumber_pdf.pages, start=1):
-                    for table in page.extract_tables() or []:
-                        table_text = normalize_table_rows(table)
-                        if table_text:
-                            elements.append(
-                                ParsedElement(
-                                    text=table_text,
-                                    page_number=page_index,
-                                    section=f"table_page_{page_index}",
-                                    element_type="table",
-                                )
-                            )
+                for table_text in table_texts:
+                    table_elements.append(
+                        ParsedElement(
+                            text=table_text,
+                            page_number=page_index,
+                            section=f"table_page_{page_index}",
+                            element_type="table",
+                        )
+                    )
         except Exception as exc:  # noqa: BLE001
             raise IngestionError(f"Failed to parse PDF {file_path.name}") from exc
-        finally:
-            if "pdf_doc" in locals():
-                pdf_doc.close()
 
-        return elements
+        return text_elements + table_elements
+
+    def _extract_pdf_pages(self, file_path: Path, page_count: int) -> list[_PdfPage]:
+        if page_count < PDF_PARALLEL_MIN_PAGES or self._pdf_workers <= 1:
+            return _extract_pdf_page_range(str(file_path), 0, page_count)
+
+        starts = list(range(0, page_count, PDF_PAGES_PER_TASK))
+        stops = [min(start + PDF_PAGES_PER_TASK, page_count) for start in starts]
+        executor = self._get_pdf_executor()
+        try:
+            batches = executor.map(
+                _extract_pdf_page_range,
+                repeat(str(file_path), len(starts)),
+                starts,
+                stops,
+            )
+            return [page for batch in batches for page in batch]
+        except BrokenProcessPool:
+            # A crashed worker poisons the pool; drop it so the next PDF starts a fresh one.
+            with self._pdf_executor_lock:
+                if self._pdf_executor is executor:
+                    self._pdf_executor = None
+            raise
+
+    def _get_pdf_executor(self) -> ProcessPoolExecutor:
+        with self._pdf_executor_lock:
+            if self._pdf_executor is None:
+                self._pdf_executor = ProcessPoolExecutor(
+                    max_workers=self._pdf_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pdf_executor
 
     def _parse_docx(self, file_path: Path) -> list[ParsedElement]:
         elements: list[ParsedElement] = []
@@ -141,17 +196,15 @@ class DocumentParser:
                     continue
                 frame = frame.fillna("")
                 header = [clean_text(str(column)) for column in frame.columns]
-                row_lines: list[str] = []
-                for _, row in frame.iterrows():
-                    pairs: list[str] = []
-                    for idx, value in enumerate(row.tolist()):
-                        column = header[idx] if idx < len(header) else f"column_{idx}"
-                        pairs.append(f"{column}: {clean_text(str(value))}")
-                    row_line = "; ".join(pairs).strip("; ").strip()
-                    if row_line:
-                        row_lines.append(row_line)
-
-                text = "\n".join(row_lines).strip()
+                # Column-wise string ops run in pandas instead of a per-cell Python loop.
+                # map(str) keeps per-value str() formatting; astype(str) would shorten datetimes.
+                cells = frame.map(str).apply(
+                    lambda column: column.str.replace(WHITESPACE_PATTERN, " ", regex=True).str.strip()
+                )
+                labeled = [f"{name}: " + cells.iloc[:, idx] for idx, name in enumerate(header)]
+                row_lines = labeled[0].str.cat(labeled[1:], sep="; ").str.strip("; ").str.strip()
+
+                text = "\n".join(line for line in row_lines if line).strip()
                 if text:
                     elements.append(
                         ParsedElement(
@@ -167,6 +220,27 @@ class DocumentParser:
         return elements
 
 
+def _extract_pdf_page_range(path: str, start: int, stop: int) -> list[_PdfPage]:
+    """Extract and normalize text and tables for pages [start, stop).
+
+    Also runs in worker processes, so text cleanup and table normalization
+    are parallelized together with extraction.
+    """
+    pages: list[_PdfPage] = []
+    with fitz.open(path) as pdf_doc:
+        for page_index in range(start, stop):
+            page = pdf_doc[page_index]
+            table_texts = [normalize_table_rows(table.extract()) for table in page.find_tables().tables]
+            pages.append(
+                (
+                    page_index + 1,
+                    clean_text(page.get_text("text")),
+                    [table_text for table_text in table_texts if table_text],
+                )
+            )
+    return pages
+
+
 def _iter_docx_blocks(doc: DocxDocument):
     parent = doc.element.body
     for child in parent.iterchildren():
@@ -177,5 +251,4 @@ def _iter_docx_blocks(doc: DocxDocument):
 
 
 def _paragraph_has_page_break(paragraph: Paragraph) -> bool:
-    paragraph_xml = paragraph._element.xml  # noqa: SLF001
-    return "w:type=\"page\"" in paragraph_xml or "w:lastRenderedPageBreak" in paragraph_xml
+    return bool(_PAGE_BREAK_XPATH(paragraph._element))  # noqa: SLF001
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime
 from pathlib import Path
-from uuid import uuid4
+from typing import Any
+from uuid import UUID
 
 from app.core.constants import UTC_TIMEZONE
 from app.ingestion.normalizer import clean_text
@@ -29,27 +31,34 @@ class IngestionPipeline:
         """Parse a document and return chunk records with metadata."""
         elements = self._parser.parse(file_path)
         timestamp = datetime.now(tz=UTC_TIMEZONE).isoformat()
-        records: list[ChunkRecord] = []
+        accepted: list[tuple[dict[str, Any], int, str]] = []
 
         for element in elements:
             chunks = self._chunker.split(element.text)
+            # Fields shared by every chunk of this element; per-chunk fields are merged in below.
+            base_metadata = {
+                "document_name": document_name,
+                "page_number": element.page_number,
+                "section": element.section,
+                "version": version,
+                "timestamp": timestamp,
+                "chunk_type": element.element_type,
+                "is_active": True,
+            }
             for chunk in chunks:
                 text = clean_text(chunk.text)
                 if not text:
                     continue
                 if element.element_type == "text" and len(text.split()) < 4:
                     continue
-                metadata = {
-                    "chunk_id": str(uuid4()),
-                    "document_name": document_name,
-                    "page_number": element.page_number,
-                    "section": element.section,
-                    "version": version,
-                    "timestamp": timestamp,
-                    "chunk_order": chunk.order,
-                    "chunk_type": element.element_type,
-                    "is_active": True,
-                }
-                records.append(ChunkRecord(text=text, metadata=metadata))
+                accepted.append((base_metadata, chunk.order, text))
+
+        # One entropy read for every chunk id instead of an os.urandom call per uuid4().
+        entropy = os.urandom(16 * len(accepted))
+        records: list[ChunkRecord] = []
+        for index, (base_metadata, chunk_order, text) in enumerate(accepted):
+            chunk_id = UUID(bytes=entropy[index * 16 : (index + 1) * 16], version=4)
+            metadata = base_metadata | {"chunk_id": str(chunk_id), "chunk_order": chunk_order}
+            records.append(ChunkRecord(text=text, metadata=metadata))
 
         return records
@@ -1,13 +1,56 @@
 """Structured JSON logging configuration."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
+import orjson
 import structlog
 
+_listener: QueueListener | None = None
+
+
+class _BatchFlushStreamHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing to the queue listener."""
+
+    def flush(self) -> None:
+        # Records are written into the stream buffer; the listener flushes once per drained batch.
+        return
+
+    def flush_batch(self) -> None:
+        super().flush()
+
+
+class _BatchFlushQueueListener(QueueListener):
+    """Queue listener that flushes handlers only when the queue runs dry."""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            self.flush_handlers()
+            return self.queue.get(block=block)
+
+    def flush_handlers(self) -> None:
+        for handler in self.handlers:
+            if isinstance(handler, _BatchFlushStreamHandler):
+                handler.flush_batch()
+            else:
+                handler.flush()
+
 
 def configure_logging(log_level: str) -> None:
-    """Configure structlog + stdlib logging output in JSON format."""
+    """Configure structlog + stdlib logging output in JSON format.
+
+    Records are rendered on the calling thread and handed to a background
+    listener thread through a queue, so request handlers never block on stdout.
+    """
+    global _listener
+
+    level = getattr(logging, log_level.upper(), logging.INFO)
     timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
 
     shared_processors = [
@@ -21,18 +64,38 @@ def configure_logging(log_level: str) -> None:
     structlog.configure(
         processors=[
             *shared_processors,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper(), logging.INFO)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper(), logging.INFO),
-        format="%(message)s",
-        stream=sys.stdout,
-    )
+    if _listener is not None:
+        _listener.stop()
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = _BatchFlushStreamHandler(stream=sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = _BatchFlushQueueListener(log_queue, stream_handler)
+    _listener.start()
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+
+def _orjson_dumps(value: Any, **kwargs: Any) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode("utf-8")
+
+
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()
+        _listener.flush_handlers()
+
+
+atexit.register(_stop_listener)
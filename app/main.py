@@ -2,57 +2,63 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
 
-from app.api.middleware import logging_middleware
+from app.api.dependency_cache import install_dependency_inspection_cache
+from app.api.deps import bind_services
+from app.api.middleware import TimingMiddleware
 from app.api.routes.ask import router as ask_router
 from app.api.routes.auth import router as auth_router
 from app.api.routes.documents import router as documents_router
 from app.api.routes.share import router as share_router
-from app.api.routes.web import BASE_DIR, router as web_router
+from app.api.routes.web import ASSETS_DIR, AssetFiles, router as web_router
 from app.config.settings import get_settings
-from app.core.constants import UTC_TIMEZONE
-from app.core.exceptions import (
-    AppError,
-    CitationValidationError,
-    EmbeddingError,
-    EmptyLLMResponseError,
-    IngestionError,
-    LLMTimeoutError,
-    ModelMemoryError,
-    QdrantUnavailableError,
-    RetrievalError,
-)
+from app.core.clock import utc_now_iso
+from app.core.exceptions import AppError, LLMTimeoutError, QdrantUnavailableError
 from app.logging.setup import configure_logging
 from app.services.container import ServiceContainer
 
 settings = get_settings()
 configure_logging(settings.log_level)
 logger = structlog.get_logger(__name__)
+install_dependency_inspection_cache()
 
 app = FastAPI(title=settings.app_name, version="1.0.0")
-app.middleware("http")(logging_middleware)
+app.add_middleware(TimingMiddleware)
 app.include_router(ask_router)
 app.include_router(documents_router)
 app.include_router(auth_router)
 app.include_router(share_router)
 app.include_router(web_router)
-app.mount("/assets", StaticFiles(directory=str(BASE_DIR / "web" / "assets")), name="assets")
+app.mount("/assets", AssetFiles(ASSETS_DIR), name="assets")
 
 
 @app.on_event("startup")
 async def on_startup() -> None:
     """Initialize dependencies and verify external services."""
     app.state.container = ServiceContainer(settings)
+    bind_services(app.state.container)
     await app.state.container.qdrant_service.healthcheck()
+    if settings.llm_preload:
+        try:
+            await app.state.container.llm_service.preload()
+        except AppError as exc:
+            # Requests retry the lazy load and report the failure themselves.
+            logger.warning("llm_preload_failed", error=str(exc))
     logger.info("startup_completed", environment=settings.environment)
 
 
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    """Release pooled outbound connections, batching tasks and worker processes."""
+    await app.state.container.market_intel_service.aclose()
+    await app.state.container.search_batcher.aclose()
+    await app.state.container.query_batcher.aclose()
+    app.state.container.document_parser.close()
+
+
 @app.get("/health")
 async def healthcheck() -> dict[str, str]:
     """Liveness endpoint."""
@@ -69,14 +75,8 @@ async def qdrant_handler(_: Request, exc: QdrantUnavailableError) -> JSONRespons
     return JSONResponse(status_code=503, content={"detail": str(exc)})
 
 
-@app.exception_handler(
-    IngestionError
-)
-@app.exception_handler(EmbeddingError)
-@app.exception_handler(RetrievalError)
-@app.exception_handler(CitationValidationError)
-@app.exception_handler(EmptyLLMResponseError)
-@app.exception_handler(ModelMemoryError)
+# Starlette resolves handlers along the exception MRO, so the 504/503 handlers above win.
+@app.exception_handler(AppError)
 async def app_error_handler(_: Request, exc: AppError) -> JSONResponse:
     return JSONResponse(status_code=500, content={"detail": str(exc)})
 
@@ -88,6 +88,6 @@ async def unhandled_error_handler(_: Request, exc: Exception) -> JSONResponse:
         status_code=500,
         content={
             "detail": "Internal server error",
-            "timestamp": datetime.now(tz=UTC_TIMEZONE).isoformat(),
+            "timestamp": utc_now_iso(),
         },
     )
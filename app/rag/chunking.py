@@ -35,20 +35,16 @@ class TextChunker:
         if not normalized:
             return []
 
+        # clean_text leaves single spaces between non-empty words, so every slice is a valid chunk.
         words = normalized.split(" ")
+        word_count = len(words)
         chunks: list[TextChunk] = []
-        start = 0
-        order = 0
         step = self._chunk_size_words - self._chunk_overlap_words
 
-        while start < len(words):
-            end = min(start + self._chunk_size_words, len(words))
-            chunk_text = " ".join(words[start:end]).strip()
-            if chunk_text:
-                chunks.append(TextChunk(text=chunk_text, order=order))
-                order += 1
-            if end == len(words):
+        for order, start in enumerate(range(0, word_count, step)):
+            end = min(start + self._chunk_size_words, word_count)
+            chunks.append(TextChunk(text=" ".join(words[start:end]), order=order))
+            if end == word_count:
                 break
-            start += step
 
         return chunks
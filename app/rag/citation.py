@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from app.models.schemas import SearchHit, SourceItem
 
+CORPUS_SEPARATOR = "\x1f"
+QUOTE_MAX_LEN = 240
+QUOTE_SCAN_LEN = QUOTE_MAX_LEN * 4
+
 
 class CitationValidator:
     """Build and verify answer citations against retrieved context."""
@@ -34,13 +38,19 @@ class CitationValidator:
     def validate(self, sources: list[SourceItem], hits: list[SearchHit]) -> bool:
         """Ensure each quote exists in at least one retrieved chunk."""
         context_texts = [hit.text for hit in hits]
+        # One C-level search per quote over all chunks; the separator keeps matches inside one chunk.
+        corpus = CORPUS_SEPARATOR.join(context_texts)
         for source in sources:
             if not source.quote:
                 return False
             quote = source.quote
             if quote.endswith("..."):
                 quote = quote[:-3].rstrip()
-            if not any(quote in text for text in context_texts):
+            if CORPUS_SEPARATOR in quote:
+                found = any(quote in text for text in context_texts)
+            else:
+                found = quote in corpus
+            if not found:
                 return False
         return True
 
@@ -57,11 +67,14 @@ class CitationValidator:
         return "\n".join(lines).strip()
 
     def _compact_quote(self, text: str) -> str:
-        cleaned = " ".join(text.split()).strip()
-        max_len = 240
-        if len(cleaned) <= max_len:
+        # Compacting a head slice yields a prefix of the compacted whole text,
+        # so the full chunk is only normalized when the head is too short.
+        cleaned = " ".join(text[:QUOTE_SCAN_LEN].split())
+        if len(cleaned) < QUOTE_MAX_LEN and len(text) > QUOTE_SCAN_LEN:
+            cleaned = " ".join(text.split())
+        if len(cleaned) <= QUOTE_MAX_LEN:
             return cleaned
-        return cleaned[:max_len].rstrip()
+        return cleaned[:QUOTE_MAX_LEN].rstrip()
 
     def _resolve_page_number(self, metadata: dict) -> int | None:
         raw_page = metadata.get("page_number")
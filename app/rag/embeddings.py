@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import threading
 from typing import Sequence
 
+import numpy as np
 from cachetools import LRUCache
 from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from app.core.batching import MicroBatcher
 from app.core.exceptions import EmbeddingError, ModelMemoryError
 
 
@@ -21,13 +24,21 @@ class EmbeddingService:
         batch_size: int,
         cache_size: int,
         retry_attempts: int,
+        max_concurrency: int = 1,
     ) -> None:
         self._model_name = model_name
         self._batch_size = batch_size
-        self._cache = LRUCache(maxsize=cache_size)
+        # Vectors are cached as float32 arrays: ~4 bytes per dimension instead of a boxed float each.
+        self._cache: LRUCache[bytes, np.ndarray] = LRUCache(maxsize=cache_size)
+        # LRUCache reorders on every read; batches embedded on parallel threads share it.
+        self._cache_lock = threading.Lock()
         self._retry_attempts = retry_attempts
         self._model = None
         self._lock = threading.Lock()
+        self._load_lock = asyncio.Lock()
+        # ONNX already spreads one batch across all cores; parallel batches only oversubscribe them.
+        self._max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
 
     def _lazy_load_model(self) -> None:
         if self._model is not None:
@@ -48,8 +59,17 @@ class EmbeddingService:
                     f"Failed to load embedding model: {self._model_name}"
                 ) from exc
 
-    def _hash_text(self, text: str) -> str:
-        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+    async def _alazy_load_model(self) -> None:
+        # Concurrent cold-start callers wait on the event loop, not in executor threads.
+        if self._model is not None:
+            return
+        async with self._load_lock:
+            if self._model is not None:
+                return
+            await asyncio.to_thread(self._lazy_load_model)
+
+    def _hash_text(self, text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
 
     def embed_texts(self, texts: Sequence[str]) -> list[list[float]]:
         """Embed non-empty texts preserving original order."""
@@ -65,6 +85,27 @@ class EmbeddingService:
                 return self._embed_once(texts)
         raise EmbeddingError("Embedding retries exhausted")
 
+    async def aembed_texts(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts on worker threads so the event loop stays responsive.
+
+        With ``max_concurrency > 1`` long inputs are split into ``batch_size``
+        groups embedded in parallel; results keep the input order.
+        """
+        await self._alazy_load_model()
+        non_empty = [text for text in texts if text.strip()]
+        if self._max_concurrency == 1 or len(non_empty) <= self._batch_size:
+            return await self._aembed_group(texts)
+        groups = [
+            non_empty[start : start + self._batch_size]
+            for start in range(0, len(non_empty), self._batch_size)
+        ]
+        results = await asyncio.gather(*(self._aembed_group(group) for group in groups))
+        return [vector for group_vectors in results for vector in group_vectors]
+
+    async def _aembed_group(self, texts: Sequence[str]) -> list[list[float]]:
+        async with self._semaphore:
+            return await asyncio.to_thread(self.embed_texts, texts)
+
     def _embed_once(self, texts: Sequence[str]) -> list[list[float]]:
         self._lazy_load_model()
         cleaned = [text.strip() for text in texts]
@@ -72,21 +113,25 @@ class EmbeddingService:
             raise EmbeddingError("No non-empty chunks for embedding")
 
         result_vectors: list[list[float] | None] = [None] * len(cleaned)
+        # Identical texts within a batch (e.g. repeated table rows) are embedded once.
+        pending: dict[bytes, list[int]] = {}
         misses: list[str] = []
-        miss_positions: list[int] = []
-        miss_keys: list[str] = []
 
         for idx, text in enumerate(cleaned):
             if not text:
                 continue
             key = self._hash_text(text)
-            cached = self._cache.get(key)
+            with self._cache_lock:
+                cached = self._cache.get(key)
             if cached is not None:
-                result_vectors[idx] = cached
-            else:
+                result_vectors[idx] = cached.tolist()
+                continue
+            positions = pending.get(key)
+            if positions is None:
+                pending[key] = [idx]
                 misses.append(text)
-                miss_positions.append(idx)
-                miss_keys.append(key)
+            else:
+                positions.append(idx)
 
         if misses:
             try:
@@ -96,12 +141,34 @@ class EmbeddingService:
             except Exception as exc:  # noqa: BLE001
                 raise EmbeddingError("Embedding generation failed") from exc
 
-            for position, key, vector in zip(miss_positions, miss_keys, vectors):
-                vector_list = vector.tolist()
-                self._cache[key] = vector_list
-                result_vectors[position] = vector_list
+            for (key, positions), vector in zip(pending.items(), vectors):
+                cached_vector = np.asarray(vector, dtype=np.float32)
+                with self._cache_lock:
+                    self._cache[key] = cached_vector
+                vector_list = cached_vector.tolist()
+                for position in positions:
+                    result_vectors[position] = vector_list
 
         embedded = [vector for vector in result_vectors if vector is not None]
         if not embedded:
             raise EmbeddingError("Embedding output is empty")
         return embedded
+
+
+class QueryEmbeddingBatcher(MicroBatcher[str, list[float]]):
+    """Coalesce concurrent single-query embeddings into one model call."""
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        max_batch: int = 16,
+        max_wait_ms: int = 5,
+    ) -> None:
+        super().__init__(max_batch=max_batch, max_wait_ms=max_wait_ms)
+        self._embedding_service = embedding_service
+
+    async def _process(self, items: list[str]) -> list[list[float]]:
+        vectors = await self._embedding_service.aembed_texts(items)
+        if len(vectors) != len(items):
+            raise EmbeddingError("Embedding count does not match query count")
+        return vectors
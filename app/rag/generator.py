@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 import time
-from datetime import datetime
+from collections.abc import AsyncIterator
 
-from app.core.constants import REFUSAL_TEXT, UTC_TIMEZONE
+from app.core.clock import utc_now
+from app.core.constants import REFUSAL_TEXT
 from app.core.exceptions import AppError, CitationValidationError
-from app.models.schemas import AnswerMode, AskResponse, QueryType, SearchHit, TokenUsage
+from app.models.schemas import (
+    AnswerMode,
+    AskResponse,
+    LLMResult,
+    QueryType,
+    SearchHit,
+    TokenUsage,
+)
 from app.rag.citation import CitationValidator
-from app.rag.retriever import Retriever
+from app.rag.retriever import RetrievalResult, Retriever
 from app.services.llm_service import LLMService
 from app.services.market_intel_service import MarketIntelService
 
 EXTRACTIVE_CONFIDENCE_FLOOR = 0.15
+MIN_QUESTION_CHARS = 3
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+# Checked in order; the first kind with a matching substring wins.
+REQUEST_KIND_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("practical", ("как", "how", "step", "шаг")),
+    ("comparison", ("сравни", "compare", "difference", "отлич")),
+    ("analytical", ("почему", "why", "reason", "причин")),
+)
 
 
 class RAGService:
@@ -43,6 +60,8 @@ class RAGService:
     ) -> AskResponse:
         """Return strict-RAG answer and validated citations."""
         started = time.perf_counter()
+        if not _is_answerable(question):
+            return self._build_refusal_response(started)
         retrieval = await self._retriever.retrieve(
             question=question,
             version=version,
@@ -55,29 +74,106 @@ class RAGService:
         context = self._build_context(retrieval.hits)
         question_profile = self._build_question_profile(question=question, query_type=query_type)
 
+        market_task = self._start_market_block(question=question, retrieval=retrieval)
         try:
-            llm_result = await self._llm_service.answer(
+            llm_result = await self._generate(
                 question=question,
                 query_type=query_type,
                 context=context,
                 question_profile=question_profile,
-                response_mode=mode,
+                mode=mode,
+                retrieval=retrieval,
             )
-        except AppError:
-            if retrieval.confidence >= EXTRACTIVE_CONFIDENCE_FLOOR:
-                llm_result = _extractive_result(
-                    self._build_extractive_fallback_answer(hits=retrieval.hits, mode=mode)
-                )
-            else:
-                return self._build_refusal_response(started)
-
-        if llm_result.answer.strip() == REFUSAL_TEXT:
-            if retrieval.confidence >= EXTRACTIVE_CONFIDENCE_FLOOR:
-                llm_result = _extractive_result(
-                    self._build_extractive_fallback_answer(hits=retrieval.hits, mode=mode)
-                )
-            else:
-                return self._build_refusal_response(started)
+            return await self._build_response(
+                llm_result=llm_result,
+                mode=mode,
+                retrieval=retrieval,
+                market_task=market_task,
+                started=started,
+            )
+        finally:
+            market_task.cancel()
+
+    async def ask_stream(
+        self,
+        question: str,
+        query_type: QueryType,
+        version: str | None = None,
+        mode: AnswerMode = AnswerMode.standard,
+        document_names: list[str] | None = None,
+    ) -> AsyncIterator[str | AskResponse]:
+        """Yield answer text pieces as they are generated, then the final response.
+
+        Streamed pieces are provisional: the closing AskResponse carries the
+        validated answer after mode formatting, fallbacks, and citations.
+        """
+        started = time.perf_counter()
+        if not _is_answerable(question):
+            yield self._build_refusal_response(started)
+            return
+        retrieval = await self._retriever.retrieve(
+            question=question,
+            version=version,
+            document_names=document_names,
+        )
+
+        if not retrieval.hits:
+            yield self._build_refusal_response(started)
+            return
+
+        context = self._build_context(retrieval.hits)
+        question_profile = self._build_question_profile(question=question, query_type=query_type)
+
+        market_task = self._start_market_block(question=question, retrieval=retrieval)
+        try:
+            pieces: list[str] = []
+            llm_result: LLMResult | None = None
+            try:
+                async for piece in self._llm_service.answer_stream(
+                    question=question,
+                    query_type=query_type,
+                    context=context,
+                    question_profile=question_profile,
+                    response_mode=mode,
+                ):
+                    pieces.append(piece)
+                    yield piece
+                streamed_answer = "".join(pieces).strip()
+                if streamed_answer:
+                    llm_result = LLMResult(answer=streamed_answer)
+            except AppError:
+                llm_result = None
+
+            yield await self._build_response(
+                llm_result=self._with_fallback(llm_result, retrieval=retrieval, mode=mode),
+                mode=mode,
+                retrieval=retrieval,
+                market_task=market_task,
+                started=started,
+            )
+        finally:
+            market_task.cancel()
+
+    def _start_market_block(
+        self,
+        question: str,
+        retrieval: RetrievalResult,
+    ) -> asyncio.Task[str | None]:
+        # Market data depends only on the question and hits; fetch it while the LLM runs.
+        return asyncio.create_task(
+            self._market_intel_service.build_market_block(question=question, hits=retrieval.hits)
+        )
+
+    async def _build_response(
+        self,
+        llm_result: LLMResult | None,
+        mode: AnswerMode,
+        retrieval: RetrievalResult,
+        market_task: asyncio.Task[str | None],
+        started: float,
+    ) -> AskResponse:
+        if llm_result is None:
+            return self._build_refusal_response(started)
 
         answer = self._apply_mode(answer=llm_result.answer, mode=mode, hits=retrieval.hits)
 
@@ -85,10 +181,7 @@ class RAGService:
         if not sources or not self._citation_validator.validate(sources, retrieval.hits):
             raise CitationValidationError("Citation validation failed")
 
-        market_block = await self._market_intel_service.build_market_block(
-            question=question,
-            hits=retrieval.hits,
-        )
+        market_block = await market_task
         market_enriched = bool(market_block)
         if market_block:
             answer = f"{answer}\n\n{market_block}"
@@ -104,7 +197,7 @@ class RAGService:
             sources=sources,
             confidence=round(retrieval.confidence, 4),
             used_documents=used_documents,
-            timestamp=datetime.now(tz=UTC_TIMEZONE),
+            timestamp=utc_now(),
             processing_time_ms=processing_ms,
             token_usage=TokenUsage(
                 input_tokens=llm_result.input_tokens,
@@ -121,20 +214,53 @@ class RAGService:
         )
         return response
 
-    def _build_context(self, hits: list[SearchHit]) -> str:
-        blocks: list[str] = []
-        for index, hit in enumerate(hits, start=1):
-            metadata = hit.metadata
-            blocks.append(
-                (
-                    f"[Source {index}] "
-                    f"Document={metadata.get('document_name', 'unknown')} "
-                    f"Page={metadata.get('page_number', 'n/a')} "
-                    f"Section={metadata.get('section', 'n/a')} "
-                    f"Version={metadata.get('version', 'unknown')}\n"
-                    f"{hit.text}"
-                )
+    async def _generate(
+        self,
+        question: str,
+        query_type: QueryType,
+        context: str,
+        question_profile: str,
+        mode: AnswerMode,
+        retrieval: RetrievalResult,
+    ) -> LLMResult | None:
+        """Return LLM answer, extractive fallback, or None when the answer must be a refusal."""
+        try:
+            llm_result = await self._llm_service.answer(
+                question=question,
+                query_type=query_type,
+                context=context,
+                question_profile=question_profile,
+                response_mode=mode,
+            )
+        except AppError:
+            llm_result = None
+        return self._with_fallback(llm_result, retrieval=retrieval, mode=mode)
+
+    def _with_fallback(
+        self,
+        llm_result: LLMResult | None,
+        retrieval: RetrievalResult,
+        mode: AnswerMode,
+    ) -> LLMResult | None:
+        """Replace a failed or refused LLM answer with an extractive one when confident enough."""
+        if llm_result is None or llm_result.answer.strip() == REFUSAL_TEXT:
+            if retrieval.confidence < EXTRACTIVE_CONFIDENCE_FLOOR:
+                return None
+            llm_result = _extractive_result(
+                self._build_extractive_fallback_answer(hits=retrieval.hits, mode=mode)
             )
+        return llm_result
+
+    def _build_context(self, hits: list[SearchHit]) -> str:
+        blocks = [
+            f"[Source {index}] "
+            f"Document={hit.metadata.get('document_name', 'unknown')} "
+            f"Page={hit.metadata.get('page_number', 'n/a')} "
+            f"Section={hit.metadata.get('section', 'n/a')} "
+            f"Version={hit.metadata.get('version', 'unknown')}\n"
+            f"{hit.text}"
+            for index, hit in enumerate(hits, start=1)
+        ]
         return "\n\n".join(blocks)
 
     def _build_question_profile(self, question: str, query_type: QueryType) -> str:
@@ -148,12 +274,9 @@ class RAGService:
 
     def _detect_request_kind(self, question: str) -> str:
         q = question.lower()
-        if any(token in q for token in ["как", "how", "step", "шаг"]):
-            return "practical"
-        if any(token in q for token in ["сравни", "compare", "difference", "отлич"]):
-            return "comparison"
-        if any(token in q for token in ["почему", "why", "reason", "причин"]):
-            return "analytical"
+        for kind, keywords in REQUEST_KIND_KEYWORDS:
+            if any(keyword in q for keyword in keywords):
+                return kind
         return "informational"
 
     def _detect_complexity(self, question: str) -> str:
@@ -208,7 +331,7 @@ class RAGService:
             sources=[],
             confidence=0.0,
             used_documents=[],
-            timestamp=datetime.now(tz=UTC_TIMEZONE),
+            timestamp=utc_now(),
             processing_time_ms=processing_ms,
             token_usage=TokenUsage(),
         )
@@ -233,7 +356,7 @@ class RAGService:
 
 
 def _first_sentences(text: str, max_sentences: int) -> str:
-    sentences = re.split(r"(?<=[.!?])\s+", text.strip())
+    sentences = SENTENCE_SPLIT_PATTERN.split(text.strip())
     cleaned = [sentence.strip() for sentence in sentences if sentence.strip()]
     return " ".join(cleaned[:max_sentences]).strip()
 
@@ -244,6 +367,12 @@ def _extractive_result(answer: str):  # noqa: ANN201
     return LLMResult(answer=answer, input_tokens=0, output_tokens=0)
 
 
+def _is_answerable(question: str) -> bool:
+    # Blank, punctuation-only or near-empty questions are refused before embedding and search.
+    stripped = question.strip()
+    return len(stripped) >= MIN_QUESTION_CHARS and any(char.isalnum() for char in stripped)
+
+
 def _get_logger(name: str):  # noqa: ANN201
     try:
         import structlog
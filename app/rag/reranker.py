@@ -4,17 +4,36 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
 
 from app.models.schemas import SearchHit
 
 TOKEN_PATTERN = re.compile(r"[0-9A-Za-zА-Яа-яЁё]+", re.IGNORECASE)
 NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)?")
+# The same chunks come back for many questions, so per-text analysis is memoized.
+TEXT_ANALYSIS_CACHE_SIZE = 4096
+
+
+class TextAnalysis(NamedTuple):
+    """Lowercased text with its token and number sets."""
 
+    lowered: str
+    tokens: frozenset[str]
+    numbers: frozenset[str]
 
-def tokenize_text(text: str, min_token_length: int = 2) -> set[str]:
+
+def tokenize_text(text: str, min_token_length: int = 2) -> frozenset[str]:
     """Tokenize latin/cyrillic alphanumeric content."""
-    tokens = {token.lower() for token in TOKEN_PATTERN.findall(text)}
-    return {token for token in tokens if len(token) >= min_token_length}
+    return analyze_text(text, min_token_length).tokens
+
+
+def analyze_text(text: str, min_token_length: int = 2) -> TextAnalysis:
+    """Return lowercased text, tokens, and numbers from one cached analysis."""
+    # Positional call keeps one cache entry per (text, length) however callers pass arguments.
+    return _analyze_cached(text, min_token_length)
 
 
 @dataclass(slots=True)
@@ -32,53 +51,48 @@ class HybridReranker:
         if not hits:
             return []
 
-        question_tokens = self._tokenize(question)
-        question_numbers = self._extract_numbers(question)
-        question_clean = " ".join(question.lower().split())
-
-        rescored: list[SearchHit] = []
-        for hit in hits:
-            semantic = self._clamp01(hit.score)
-            lexical = self._lexical_overlap(question_tokens, hit.text)
-            numeric = self._numeric_overlap(question_numbers, hit.text)
-            phrase = self.phrase_bonus if question_clean and question_clean in hit.text.lower() else 0.0
-
-            fused = (
-                semantic * self.semantic_weight
-                + lexical * self.lexical_weight
-                + numeric * self.numeric_weight
-                + phrase
-            )
-
-            hit.score = self._clamp01(fused)
-            rescored.append(hit)
-
-        rescored.sort(key=lambda item: item.score, reverse=True)
-        return rescored[:top_k]
-
-    def _tokenize(self, text: str) -> set[str]:
-        return tokenize_text(text=text, min_token_length=self.min_token_length)
-
-    def _extract_numbers(self, text: str) -> set[str]:
-        return {raw.replace(",", ".") for raw in NUMBER_PATTERN.findall(text)}
-
-    def _lexical_overlap(self, question_tokens: set[str], chunk_text: str) -> float:
-        if not question_tokens:
-            return 0.0
-        chunk_tokens = self._tokenize(chunk_text)
-        if not chunk_tokens:
-            return 0.0
-        shared = question_tokens.intersection(chunk_tokens)
-        return len(shared) / len(question_tokens)
-
-    def _numeric_overlap(self, question_numbers: set[str], chunk_text: str) -> float:
-        if not question_numbers:
-            return 0.0
-        chunk_numbers = self._extract_numbers(chunk_text)
-        if not chunk_numbers:
-            return 0.0
-        shared = question_numbers.intersection(chunk_numbers)
-        return len(shared) / len(question_numbers)
-
-    def _clamp01(self, value: float) -> float:
-        return max(0.0, min(1.0, value))
+        question_analysis = analyze_text(question, self.min_token_length)
+        question_clean = " ".join(question_analysis.lowered.split())
+
+        count = len(hits)
+        semantic = np.fromiter((hit.score for hit in hits), dtype=np.float64, count=count)
+        lexical = np.empty(count)
+        numeric = np.empty(count)
+        phrase = np.zeros(count)
+        for index, hit in enumerate(hits):
+            chunk = analyze_text(hit.text, self.min_token_length)
+            lexical[index] = _overlap_ratio(question_analysis.tokens, chunk.tokens)
+            numeric[index] = _overlap_ratio(question_analysis.numbers, chunk.numbers)
+            if question_clean and question_clean in chunk.lowered:
+                phrase[index] = self.phrase_bonus
+
+        fused = np.clip(
+            np.clip(semantic, 0.0, 1.0) * self.semantic_weight
+            + lexical * self.lexical_weight
+            + numeric * self.numeric_weight
+            + phrase,
+            0.0,
+            1.0,
+        )
+        for hit, score in zip(hits, fused.tolist()):
+            hit.score = score
+
+        # Stable order keeps retrieval order among equal scores, as list.sort did.
+        ranked = np.argsort(-fused, kind="stable")[: max(top_k, 0)]
+        return [hits[index] for index in ranked.tolist()]
+
+
+def _overlap_ratio(question_items: frozenset[str], chunk_items: frozenset[str]) -> float:
+    if not question_items or not chunk_items:
+        return 0.0
+    return len(question_items & chunk_items) / len(question_items)
+
+
+@lru_cache(maxsize=TEXT_ANALYSIS_CACHE_SIZE)
+def _analyze_cached(text: str, min_token_length: int) -> TextAnalysis:
+    lowered = text.lower()
+    tokens = frozenset(
+        token for token in TOKEN_PATTERN.findall(lowered) if len(token) >= min_token_length
+    )
+    numbers = frozenset(raw.replace(",", ".") for raw in NUMBER_PATTERN.findall(lowered))
+    return TextAnalysis(lowered=lowered, tokens=tokens, numbers=numbers)
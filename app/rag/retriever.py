@@ -8,9 +8,18 @@ from typing import Protocol
 
 from app.core.exceptions import RetrievalError
 from app.models.schemas import SearchHit
-from app.rag.embeddings import EmbeddingService
+from app.rag.embeddings import EmbeddingService, QueryEmbeddingBatcher
 from app.rag.reranker import HybridReranker, tokenize_text
 
+# Fallback thresholds applied when no reranked hit clears the similarity threshold.
+FALLBACK_MIN_OVERLAP = 0.2
+FALLBACK_PARTIAL_OVERLAP_MIN_SCORE = 0.06
+FALLBACK_SHORT_QUERY_MAX_WORDS = 3
+FALLBACK_LAST_RESORT_MIN_SCORE = 0.02
+
+DEDUPE_KEY_LEN = 220
+DEDUPE_SCAN_LEN = DEDUPE_KEY_LEN * 4
+
 
 class VectorSearchClient(Protocol):
     """Protocol for vector DB search clients."""
@@ -44,13 +53,18 @@ class Retriever:
         similarity_threshold: float,
         candidate_k: int | None = None,
         reranker: HybridReranker | None = None,
+        query_batcher: QueryEmbeddingBatcher | None = None,
+        speculative_fallback: bool = False,
     ) -> None:
         self._embedding_service = embedding_service
         self._qdrant_service = qdrant_service
         self._top_k = top_k
         self._candidate_k = max(top_k, candidate_k or top_k)
         self._similarity_threshold = similarity_threshold
+        self._short_query_cutoff = max(0.05, similarity_threshold * 0.25)
         self._reranker = reranker or HybridReranker()
+        self._query_batcher = query_batcher or QueryEmbeddingBatcher(embedding_service)
+        self._speculative_fallback = speculative_fallback
         self._logger = _get_logger(__name__)
 
     async def retrieve(
@@ -62,22 +76,14 @@ class Retriever:
         """Return hits that pass configured relevance threshold."""
         normalized_document_names = _normalize_document_names(document_names)
         try:
-            vectors = await asyncio.to_thread(self._embedding_service.embed_texts, [question])
-            query_vector = vectors[0]
-            hits = await self._qdrant_service.search(
-                query_vector=query_vector,
-                top_k=self._candidate_k,
-                version=version,
-                document_names=normalized_document_names,
-            )
-            if not hits and version and not normalized_document_names:
-                # Fallback when user selected an outdated/incorrect version.
-                hits = await self._qdrant_service.search(
-                    query_vector=query_vector,
-                    top_k=self._candidate_k,
-                    version=None,
-                    document_names=normalized_document_names,
-                )
+            query_vector = await self._query_batcher.submit(question)
+            if version and not normalized_document_names and self._speculative_fallback:
+                hits = await self._search_with_speculative_fallback(query_vector, version)
+            else:
+                hits = await self._search(query_vector, version, normalized_document_names)
+                if not hits and version and not normalized_document_names:
+                    # Fallback when user selected an outdated/incorrect version.
+                    hits = await self._search(query_vector, None, normalized_document_names)
         except Exception as exc:  # noqa: BLE001
             raise RetrievalError("Retrieval pipeline failed") from exc
 
@@ -86,25 +92,29 @@ class Retriever:
 
         if not filtered and reranked:
             query_tokens = _tokenize(question)
-            lexical_ranked = sorted(
-                reranked,
-                key=lambda hit: (_lexical_overlap(query_tokens, hit.text), hit.score),
-                reverse=True,
+            # One overlap per hit; max() keeps the first of equal keys, as the stable sort did.
+            overlaps = [_lexical_overlap(query_tokens, hit.text) for hit in reranked]
+            best_index = max(
+                range(len(reranked)),
+                key=lambda index: (overlaps[index], reranked[index].score),
             )
-            best_lexical = lexical_ranked[0]
-            best_lexical_overlap = _lexical_overlap(query_tokens, best_lexical.text)
+            best_lexical = reranked[best_index]
+            best_lexical_overlap = overlaps[best_index]
 
-            if best_lexical_overlap >= 0.2 or (
-                best_lexical_overlap > 0.0 and best_lexical.score >= 0.06
+            if best_lexical_overlap >= FALLBACK_MIN_OVERLAP or (
+                best_lexical_overlap > 0.0
+                and best_lexical.score >= FALLBACK_PARTIAL_OVERLAP_MIN_SCORE
             ):
                 filtered = [best_lexical]
             else:
                 # Soft fallback for short/ambiguous queries.
                 best = max(reranked, key=lambda hit: hit.score)
-                short_query_cutoff = max(0.05, self._similarity_threshold * 0.25)
-                if len(question.split()) <= 3 and best.score >= short_query_cutoff:
+                if (
+                    best.score >= self._short_query_cutoff
+                    and len(question.split()) <= FALLBACK_SHORT_QUERY_MAX_WORDS
+                ):
                     filtered = [best]
-                elif best.score >= 0.02:
+                elif best.score >= FALLBACK_LAST_RESORT_MIN_SCORE:
                     # Last-resort fallback: keep best candidate to avoid false refusals.
                     filtered = [best]
 
@@ -120,8 +130,38 @@ class Retriever:
         )
         return RetrievalResult(hits=filtered, confidence=confidence)
 
+    async def _search(
+        self,
+        query_vector: list[float],
+        version: str | None,
+        document_names: list[str] | None,
+    ) -> list[SearchHit]:
+        return await self._qdrant_service.search(
+            query_vector=query_vector,
+            top_k=self._candidate_k,
+            version=version,
+            document_names=document_names,
+        )
+
+    async def _search_with_speculative_fallback(
+        self,
+        query_vector: list[float],
+        version: str,
+    ) -> list[SearchHit]:
+        # Unversioned search runs alongside so an empty versioned result costs no extra round-trip.
+        versioned = asyncio.create_task(self._search(query_vector, version, None))
+        unversioned = asyncio.create_task(self._search(query_vector, None, None))
+        try:
+            hits = await versioned
+            if hits:
+                return hits
+            return await unversioned
+        finally:
+            versioned.cancel()
+            unversioned.cancel()
+
 
-def _tokenize(text: str) -> set[str]:
+def _tokenize(text: str) -> frozenset[str]:
     return tokenize_text(text)
 
 
@@ -142,7 +182,7 @@ def _normalize_document_names(document_names: list[str] | None) -> list[str] | N
     return cleaned or None
 
 
-def _lexical_overlap(question_tokens: set[str], chunk_text: str) -> float:
+def _lexical_overlap(question_tokens: frozenset[str], chunk_text: str) -> float:
     if not question_tokens:
         return 0.0
     chunk_tokens = _tokenize(chunk_text)
@@ -156,10 +196,11 @@ def _deduplicate_hits(hits: list[SearchHit], limit: int) -> list[SearchHit]:
     deduped: list[SearchHit] = []
     seen: set[tuple[str, str, str]] = set()
     for hit in hits:
+        metadata = hit.metadata
         key = (
-            str(hit.metadata.get("document_name", "")),
-            str(hit.metadata.get("section", "")),
-            " ".join(hit.text.split())[:220],
+            str(metadata.get("document_name", "")),
+            str(metadata.get("section", "")),
+            _dedupe_text_key(hit.text),
         )
         if key in seen:
             continue
@@ -170,6 +211,14 @@ def _deduplicate_hits(hits: list[SearchHit], limit: int) -> list[SearchHit]:
     return deduped
 
 
+def _dedupe_text_key(text: str) -> str:
+    # Normalizing a head slice gives the same leading characters as normalizing the whole chunk.
+    key = " ".join(text[:DEDUPE_SCAN_LEN].split())
+    if len(key) < DEDUPE_KEY_LEN and len(text) > DEDUPE_SCAN_LEN:
+        key = " ".join(text.split())
+    return key[:DEDUPE_KEY_LEN]
+
+
 def _get_logger(name: str):  # noqa: ANN201
     try:
         import structlog
@@ -7,7 +7,7 @@ from app.ingestion.parsers import DocumentParser
 from app.ingestion.pipeline import IngestionPipeline
 from app.rag.chunking import TextChunker
 from app.rag.citation import CitationValidator
-from app.rag.embeddings import EmbeddingService
+from app.rag.embeddings import EmbeddingService, QueryEmbeddingBatcher
 from app.rag.generator import RAGService
 from app.rag.reranker import HybridReranker
 from app.rag.retriever import Retriever
@@ -15,7 +15,9 @@ from app.services.document_service import DocumentService
 from app.services.llm_service import LLMService
 from app.services.auth_service import AuthService
 from app.services.market_intel_service import MarketIntelService
-from app.services.qdrant_service import QdrantService
+from app.services.qdrant_service import QdrantService, VectorSearchBatcher
+from app.services.response_cache import ResponseCache
+from app.services.token_cache import TokenCache
 
 
 class ServiceContainer:
@@ -29,6 +31,7 @@ class ServiceContainer:
             batch_size=settings.embedding_batch_size,
             cache_size=settings.embedding_cache_size,
             retry_attempts=settings.embedding_retry_attempts,
+            max_concurrency=settings.embedding_max_concurrency,
         )
         self.qdrant_service = QdrantService(
             mode=settings.qdrant_mode,
@@ -37,10 +40,23 @@ class ServiceContainer:
             collection_name=settings.qdrant_collection,
             timeout_sec=settings.qdrant_timeout_sec,
             api_key=settings.qdrant_api_key,
+            hnsw_ef=settings.qdrant_hnsw_ef,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            grpc_port=settings.qdrant_grpc_port,
+        )
+        self.search_batcher = VectorSearchBatcher(
+            self.qdrant_service,
+            max_batch=settings.qdrant_search_batch_size,
+            max_wait_ms=settings.qdrant_search_batch_wait_ms,
+        )
+        self.query_batcher = QueryEmbeddingBatcher(
+            self.embedding_service,
+            max_batch=settings.query_embedding_batch_size,
+            max_wait_ms=settings.query_embedding_batch_wait_ms,
         )
         self.retriever = Retriever(
             embedding_service=self.embedding_service,
-            qdrant_service=self.qdrant_service,
+            qdrant_service=self.search_batcher,
             top_k=settings.retrieval_top_k,
             similarity_threshold=settings.similarity_threshold,
             candidate_k=settings.retrieval_candidate_k,
@@ -50,6 +66,8 @@ class ServiceContainer:
                 numeric_weight=settings.reranker_numeric_weight,
                 phrase_bonus=settings.reranker_phrase_bonus,
             ),
+            query_batcher=self.query_batcher,
+            speculative_fallback=settings.retrieval_speculative_fallback,
         )
         self.llm_service = LLMService(
             provider=settings.llm_provider,
@@ -64,6 +82,19 @@ class ServiceContainer:
             local_model_filename=settings.local_model_filename,
             local_context_size=settings.local_model_context_size,
             local_threads=settings.local_model_threads,
+            local_queue_size=settings.local_model_queue_size,
+            local_gpu_layers=settings.local_model_gpu_layers,
+            local_flash_attn=settings.local_model_flash_attn,
+            local_batch_size=settings.local_model_batch_size,
+            local_ubatch_size=settings.local_model_ubatch_size,
+            response_cache=(
+                ResponseCache(
+                    maxsize=settings.llm_response_cache_size,
+                    ttl_sec=settings.llm_response_cache_ttl_sec,
+                )
+                if settings.llm_response_cache_size > 0
+                else None
+            ),
         )
         self.citation_validator = CitationValidator(
             max_sources=settings.max_sources_per_answer
@@ -79,19 +110,24 @@ class ServiceContainer:
             market_intel_service=self.market_intel_service,
         )
 
-        parser = DocumentParser()
+        self.document_parser = DocumentParser(pdf_workers=settings.pdf_parse_workers)
         chunker = TextChunker(
             chunk_size_words=settings.chunk_size_words,
             chunk_overlap_words=settings.chunk_overlap_words,
         )
-        ingestion_pipeline = IngestionPipeline(parser=parser, chunker=chunker)
+        ingestion_pipeline = IngestionPipeline(parser=self.document_parser, chunker=chunker)
         self.document_service = DocumentService(
             storage_path=settings.document_storage_path,
             ingestion_pipeline=ingestion_pipeline,
             embedding_service=self.embedding_service,
             qdrant_service=self.qdrant_service,
+            batch_size=settings.ingest_batch_size,
         )
         self.auth_service = AuthService(
             db_path=settings.app_db_path,
             session_ttl_hours=settings.auth_session_ttl_hours,
         )
+        self.token_cache = TokenCache(
+            maxsize=settings.auth_token_cache_size,
+            ttl_sec=settings.auth_token_cache_ttl_sec,
+        )
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import shutil
 from datetime import datetime
 from pathlib import Path
 from uuid import uuid4
@@ -13,7 +12,7 @@ import structlog
 from app.core.constants import UTC_TIMEZONE
 from app.core.exceptions import IngestionError
 from app.ingestion.pipeline import IngestionPipeline
-from app.models.schemas import UploadResponse
+from app.models.schemas import ChunkRecord, UploadResponse
 from app.rag.embeddings import EmbeddingService
 from app.services.qdrant_service import QdrantService
 
@@ -27,12 +26,17 @@ class DocumentService:
         ingestion_pipeline: IngestionPipeline,
         embedding_service: EmbeddingService,
         qdrant_service: QdrantService,
+        batch_size: int = 64,
     ) -> None:
         self._storage_path = storage_path
         self._storage_path.mkdir(parents=True, exist_ok=True)
         self._ingestion_pipeline = ingestion_pipeline
         self._embedding_service = embedding_service
         self._qdrant_service = qdrant_service
+        self._batch_size = max(1, batch_size)
+        # Vector size the collection was last verified for; the embedding model fixes it per process.
+        self._collection_vector_size: int | None = None
+        self._collection_lock = asyncio.Lock()
         self._logger = structlog.get_logger(__name__)
 
     async def ingest_file(
@@ -42,7 +46,9 @@ class DocumentService:
         version: str,
     ) -> UploadResponse:
         """Parse, embed, and index file in Qdrant."""
-        chunks = self._ingestion_pipeline.process_document(
+        # Parsing is CPU-bound and may wait on PDF worker start-up; keep it off the event loop.
+        chunks = await asyncio.to_thread(
+            self._ingestion_pipeline.process_document,
             file_path=source_file,
             document_name=original_name,
             version=version,
@@ -50,13 +56,7 @@ class DocumentService:
         if not chunks:
             raise IngestionError("Parsed document contains no chunks")
 
-        embeddings = await asyncio.to_thread(
-            self._embedding_service.embed_texts,
-            [chunk.text for chunk in chunks],
-        )
-        vector_size = len(embeddings[0])
-        await self._qdrant_service.ensure_collection(vector_size=vector_size)
-        await self._qdrant_service.upsert_chunks(chunks=chunks, embeddings=embeddings)
+        await self._index_chunks(chunks)
 
         now = datetime.now(tz=UTC_TIMEZONE)
         self._logger.info(
@@ -73,12 +73,53 @@ class DocumentService:
             timestamp=now,
         )
 
-    def persist_temp_file(self, temp_path: Path, filename: str) -> Path:
-        """Persist uploaded file under unique name in storage."""
+    async def _index_chunks(self, chunks: list[ChunkRecord]) -> None:
+        """Embed and upsert chunks in batches, embedding the next batch while one is upserted."""
+        batches = [
+            chunks[start : start + self._batch_size]
+            for start in range(0, len(chunks), self._batch_size)
+        ]
+        indexed: list[ChunkRecord] = []
+        next_embeddings = asyncio.create_task(self._embed_batch(batches[0]))
+        try:
+            for index, batch in enumerate(batches):
+                embeddings = await next_embeddings
+                if index + 1 < len(batches):
+                    next_embeddings = asyncio.create_task(self._embed_batch(batches[index + 1]))
+                if index == 0:
+                    await self._ensure_collection(vector_size=len(embeddings[0]))
+                # Only the final batch waits for indexing; earlier ones are applied before it.
+                await self._qdrant_service.upsert_chunks(
+                    chunks=batch,
+                    embeddings=embeddings,
+                    wait=index == len(batches) - 1,
+                )
+                indexed.extend(batch)
+        except BaseException:
+            next_embeddings.cancel()
+            # The collection may be the cause; verify it again on the next ingest.
+            self._collection_vector_size = None
+            if indexed:
+                # A failed ingest must not leave part of the document searchable.
+                await self._qdrant_service.delete_chunks(indexed)
+            raise
+
+    async def _ensure_collection(self, vector_size: int) -> None:
+        if self._collection_vector_size == vector_size:
+            return
+        async with self._collection_lock:
+            if self._collection_vector_size == vector_size:
+                return
+            await self._qdrant_service.ensure_collection(vector_size=vector_size)
+            self._collection_vector_size = vector_size
+
+    async def _embed_batch(self, batch: list[ChunkRecord]) -> list[list[float]]:
+        return await self._embedding_service.aembed_texts([chunk.text for chunk in batch])
+
+    def build_storage_path(self, filename: str) -> Path:
+        """Return unique storage path for an uploaded file."""
         safe_name = filename.replace("/", "_").replace("\\", "_").strip()
-        destination = self._storage_path / f"{uuid4()}_{safe_name}"
-        shutil.move(str(temp_path), destination)
-        return destination
+        return self._storage_path / f"{uuid4()}_{safe_name}"
 
     async def soft_delete(self, document_name: str, version: str | None = None) -> int:
         """Soft-delete vectors for specific document/version."""
@@ -3,19 +3,36 @@
 from __future__ import annotations
 
 import asyncio
+import queue
+import string
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future
+from functools import partial
 from pathlib import Path
 import threading
 from abc import ABC, abstractmethod
 
+import structlog
+
 from app.core.constants import REFUSAL_TEXT
 from app.core.exceptions import EmptyLLMResponseError, LLMTimeoutError, ModelMemoryError
-from app.core.prompts import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from app.core.prompts import RESPONSE_FRAMING_TEMPLATE, SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
 from app.models.schemas import AnswerMode, LLMResult, QueryType
+from app.services.response_cache import (
+    RESPONSE_CACHE_MAX_TEMPERATURE,
+    ResponseCache,
+    response_key,
+)
+
+logger = structlog.get_logger(__name__)
 
 
 class BaseLLMClient(ABC):
     """Base class for LLM providers."""
 
+    async def preload(self) -> None:
+        """Prepare the backend ahead of the first request."""
+
     @abstractmethod
     async def generate(
         self,
@@ -27,6 +44,17 @@ class BaseLLMClient(ABC):
     ) -> LLMResult:
         """Generate answer from question + context."""
 
+    @abstractmethod
+    def generate_stream(
+        self,
+        question: str,
+        query_type: QueryType,
+        context: str,
+        question_profile: str,
+        response_mode: AnswerMode,
+    ) -> AsyncIterator[str]:
+        """Yield answer text pieces as they are generated."""
+
 
 class OpenAIClient(BaseLLMClient):
     """OpenAI API-based client."""
@@ -59,6 +87,9 @@ class OpenAIClient(BaseLLMClient):
 
             self._client = AsyncOpenAI(api_key=self._api_key, base_url=self._base_url)
 
+    async def preload(self) -> None:
+        self._lazy_load_client()
+
     async def generate(
         self,
         question: str,
@@ -68,13 +99,12 @@ class OpenAIClient(BaseLLMClient):
         response_mode: AnswerMode,
     ) -> LLMResult:
         self._lazy_load_client()
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            query_type=query_type.value,
-            response_mode=response_mode.value,
-            mode_instruction=_mode_instruction(response_mode),
-            question_profile=question_profile,
+        messages = _build_messages(
             question=question,
+            query_type=query_type,
             context=context,
+            question_profile=question_profile,
+            response_mode=response_mode,
         )
 
         try:
@@ -83,10 +113,7 @@ class OpenAIClient(BaseLLMClient):
                     model=self._model_name,
                     temperature=self._temperature,
                     max_tokens=self._max_tokens,
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT.strip()},
-                        {"role": "user", "content": user_prompt.strip()},
-                    ],
+                    messages=messages,
                 ),
                 timeout=self._timeout_sec,
             )
@@ -106,6 +133,46 @@ class OpenAIClient(BaseLLMClient):
             output_tokens=getattr(usage, "completion_tokens", 0) or 0,
         )
 
+    async def generate_stream(
+        self,
+        question: str,
+        query_type: QueryType,
+        context: str,
+        question_profile: str,
+        response_mode: AnswerMode,
+    ) -> AsyncIterator[str]:
+        self._lazy_load_client()
+        messages = _build_messages(
+            question=question,
+            query_type=query_type,
+            context=context,
+            question_profile=question_profile,
+            response_mode=response_mode,
+        )
+        deadline = asyncio.get_running_loop().time() + self._timeout_sec
+
+        try:
+            stream = await asyncio.wait_for(
+                self._client.chat.completions.create(  # type: ignore[union-attr]
+                    model=self._model_name,
+                    temperature=self._temperature,
+                    max_tokens=self._max_tokens,
+                    messages=messages,
+                    stream=True,
+                ),
+                timeout=_remaining(deadline),
+            )
+            chunks = stream.__aiter__()
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(anext(chunks), timeout=_remaining(deadline))
+                except StopAsyncIteration:
+                    break
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except (TimeoutError, asyncio.TimeoutError) as exc:
+            raise LLMTimeoutError("OpenAI request timeout") from exc
+
 
 class LocalLlamaClient(BaseLLMClient):
     """llama.cpp local model backend."""
@@ -121,6 +188,11 @@ class LocalLlamaClient(BaseLLMClient):
         threads: int,
         model_repo_id: str | None = None,
         model_filename: str | None = None,
+        queue_size: int = 32,
+        gpu_layers: int = -1,
+        flash_attn: bool = True,
+        batch_size: int = 512,
+        ubatch_size: int = 256,
     ) -> None:
         self._model_path = model_path
         self._model_name = model_name
@@ -131,9 +203,15 @@ class LocalLlamaClient(BaseLLMClient):
         self._threads = threads
         self._model_repo_id = model_repo_id
         self._model_filename = model_filename
+        self._gpu_layers = gpu_layers
+        self._flash_attn = flash_attn
+        self._batch_size = batch_size
+        self._ubatch_size = ubatch_size
         self._llm = None
         self._lock = threading.Lock()
-        self._inference_lock = threading.Lock()
+        # The model is not reentrant: one long-lived thread owns it and runs queued jobs in order.
+        self._jobs: queue.Queue[Callable[[], None]] = queue.Queue(maxsize=max(1, queue_size))
+        self._worker: threading.Thread | None = None
 
     def _ensure_model_exists(self) -> str:
         model_path = Path(self._model_path)
@@ -169,12 +247,17 @@ class LocalLlamaClient(BaseLLMClient):
                 return
             resolved_model_path = self._ensure_model_exists()
             try:
-                from llama_cpp import Llama
+                from llama_cpp import Llama, llama_supports_gpu_offload
 
                 self._llm = Llama(
                     model_path=resolved_model_path,
                     n_ctx=self._context_size,
                     n_threads=self._threads,
+                    n_threads_batch=self._threads,
+                    n_gpu_layers=self._gpu_layers,
+                    flash_attn=self._flash_attn,
+                    n_batch=self._batch_size,
+                    n_ubatch=self._ubatch_size,
                     verbose=False,
                 )
             except MemoryError as exc:
@@ -183,6 +266,33 @@ class LocalLlamaClient(BaseLLMClient):
                 raise ModelMemoryError(
                     f"Failed to initialize local model: {self._model_path}"
                 ) from exc
+            # CPU-only llama.cpp builds silently ignore n_gpu_layers; surface whether offload happens.
+            logger.info(
+                "local_llm_loaded",
+                model_path=resolved_model_path,
+                gpu_offload=bool(llama_supports_gpu_offload()) and self._gpu_layers != 0,
+                gpu_layers=self._gpu_layers,
+                flash_attn=self._flash_attn,
+            )
+            self._worker = threading.Thread(
+                target=self._run_jobs, name="llama-inference", daemon=True
+            )
+            self._worker.start()
+
+    async def preload(self) -> None:
+        if self._llm is None:
+            # Loading (and possibly downloading) the model blocks for seconds; keep it off the loop.
+            await asyncio.to_thread(self._lazy_load_model)
+
+    def _run_jobs(self) -> None:
+        while True:
+            self._jobs.get()()
+
+    def _enqueue(self, job: Callable[[], None]) -> None:
+        try:
+            self._jobs.put_nowait(job)
+        except queue.Full as exc:
+            raise LLMTimeoutError("Local LLM queue is full") from exc
 
     async def generate(
         self,
@@ -192,30 +302,36 @@ class LocalLlamaClient(BaseLLMClient):
         question_profile: str,
         response_mode: AnswerMode,
     ) -> LLMResult:
-        self._lazy_load_model()
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            query_type=query_type.value,
-            response_mode=response_mode.value,
-            mode_instruction=_mode_instruction(response_mode),
-            question_profile=question_profile,
+        await self.preload()
+        messages = _build_messages(
             question=question,
+            query_type=query_type,
             context=context,
+            question_profile=question_profile,
+            response_mode=response_mode,
         )
 
-        def _run_completion() -> dict:
-            with self._inference_lock:
-                return self._llm.create_chat_completion(  # type: ignore[union-attr]
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT.strip()},
-                        {"role": "user", "content": user_prompt.strip()},
-                    ],
-                    max_tokens=self._max_tokens,
-                    temperature=self._temperature,
+        result: Future[dict] = Future()
+
+        def _run_completion() -> None:
+            # Skips requests that timed out while still queued.
+            if not result.set_running_or_notify_cancel():
+                return
+            try:
+                result.set_result(
+                    self._llm.create_chat_completion(  # type: ignore[union-attr]
+                        messages=messages,
+                        max_tokens=self._max_tokens,
+                        temperature=self._temperature,
+                    )
                 )
+            except BaseException as exc:  # noqa: BLE001
+                result.set_exception(exc)
 
+        self._enqueue(_run_completion)
         try:
             response = await asyncio.wait_for(
-                asyncio.to_thread(_run_completion),
+                asyncio.wrap_future(result),
                 timeout=self._timeout_sec,
             )
         except TimeoutError as exc:
@@ -240,6 +356,74 @@ class LocalLlamaClient(BaseLLMClient):
             output_tokens=int(usage.get("completion_tokens", 0)),
         )
 
+    async def generate_stream(
+        self,
+        question: str,
+        query_type: QueryType,
+        context: str,
+        question_profile: str,
+        response_mode: AnswerMode,
+    ) -> AsyncIterator[str]:
+        await self.preload()
+        messages = _build_messages(
+            question=question,
+            query_type=query_type,
+            context=context,
+            question_profile=question_profile,
+            response_mode=response_mode,
+        )
+        loop = asyncio.get_running_loop()
+        pieces: asyncio.Queue[str | BaseException | None] = asyncio.Queue()
+        stop = threading.Event()
+
+        def _publish(item: str | BaseException | None) -> None:
+            try:
+                loop.call_soon_threadsafe(pieces.put_nowait, item)
+            except RuntimeError:
+                # Event loop already closed; nobody is listening anymore.
+                pass
+
+        def _run_stream() -> None:
+            if stop.is_set():
+                return
+            try:
+                for chunk in self._llm.create_chat_completion(  # type: ignore[union-attr]
+                    messages=messages,
+                    max_tokens=self._max_tokens,
+                    temperature=self._temperature,
+                    stream=True,
+                ):
+                    if stop.is_set():
+                        break
+                    piece = chunk["choices"][0]["delta"].get("content")
+                    if piece:
+                        _publish(piece)
+            except BaseException as exc:  # noqa: BLE001
+                _publish(exc)
+            else:
+                _publish(None)
+
+        deadline = loop.time() + self._timeout_sec
+        self._enqueue(_run_stream)
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(pieces.get(), timeout=_remaining(deadline))
+                except (TimeoutError, asyncio.TimeoutError) as exc:
+                    raise LLMTimeoutError("Local LLM timeout") from exc
+                if item is None:
+                    break
+                if isinstance(item, MemoryError):
+                    raise ModelMemoryError("Memory overflow during local generation") from item
+                if isinstance(item, OSError):
+                    raise ModelMemoryError("Local LLM runtime error") from item
+                if isinstance(item, BaseException):
+                    raise EmptyLLMResponseError("Local LLM generation failed") from item
+                yield item
+        finally:
+            # Lets the worker move on to the next job if the consumer stops early.
+            stop.set()
+
 
 class LLMService:
     """Factory wrapper that routes generation to selected provider."""
@@ -258,7 +442,17 @@ class LLMService:
         local_model_filename: str | None = None,
         local_context_size: int = 4096,
         local_threads: int = 8,
+        local_queue_size: int = 32,
+        local_gpu_layers: int = -1,
+        local_flash_attn: bool = True,
+        local_batch_size: int = 512,
+        local_ubatch_size: int = 256,
+        response_cache: ResponseCache | None = None,
     ) -> None:
+        self._response_cache = (
+            response_cache if temperature <= RESPONSE_CACHE_MAX_TEMPERATURE else None
+        )
+        self._inflight: dict[bytes, asyncio.Task[LLMResult]] = {}
         if provider == "api":
             if not api_key:
                 raise ValueError("OPENAI_API_KEY is required when llm_provider=api")
@@ -283,10 +477,19 @@ class LLMService:
                 threads=local_threads,
                 model_repo_id=local_model_repo_id,
                 model_filename=local_model_filename,
+                queue_size=local_queue_size,
+                gpu_layers=local_gpu_layers,
+                flash_attn=local_flash_attn,
+                batch_size=local_batch_size,
+                ubatch_size=local_ubatch_size,
             )
         else:
             raise ValueError("llm_provider must be one of: api, local")
 
+    async def preload(self) -> None:
+        """Load the selected backend so the first question does not pay for it."""
+        await self._client.preload()
+
     async def answer(
         self,
         question: str,
@@ -298,13 +501,112 @@ class LLMService:
         """Generate answer or refusal when context is empty."""
         if not context.strip():
             return LLMResult(answer=REFUSAL_TEXT)
-        return await self._client.generate(
+        generate = partial(
+            self._client.generate,
             question=question,
             query_type=query_type,
             context=context,
             question_profile=question_profile,
             response_mode=response_mode,
         )
+        cache_key = self._cache_key(question, query_type, context, question_profile, response_mode)
+        if cache_key is None:
+            return await generate()
+        cached = self._response_cache.get(cache_key)  # type: ignore[union-attr]
+        if cached is not None:
+            return cached
+        task = self._inflight.get(cache_key)
+        if task is None:
+            # Identical concurrent requests share one generation instead of queueing behind it.
+            task = asyncio.create_task(generate())
+            self._inflight[cache_key] = task
+            task.add_done_callback(partial(self._finish_generation, cache_key))
+        # Shielded so one cancelled caller does not abort the answer others are waiting for.
+        return await asyncio.shield(task)
+
+    async def answer_stream(
+        self,
+        question: str,
+        query_type: QueryType,
+        context: str,
+        question_profile: str = "",
+        response_mode: AnswerMode = AnswerMode.standard,
+    ) -> AsyncIterator[str]:
+        """Stream answer pieces, or the refusal text when context is empty."""
+        if not context.strip():
+            yield REFUSAL_TEXT
+            return
+        cache_key = self._cache_key(question, query_type, context, question_profile, response_mode)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)  # type: ignore[union-attr]
+            if cached is not None:
+                yield cached.answer
+                return
+        pieces: list[str] = []
+        async for piece in self._client.generate_stream(
+            question=question,
+            query_type=query_type,
+            context=context,
+            question_profile=question_profile,
+            response_mode=response_mode,
+        ):
+            pieces.append(piece)
+            yield piece
+        answer = "".join(pieces).strip()
+        if cache_key is not None and answer:
+            self._response_cache.set(cache_key, LLMResult(answer=answer))  # type: ignore[union-attr]
+
+    def _finish_generation(self, cache_key: bytes, task: asyncio.Task[LLMResult]) -> None:
+        self._inflight.pop(cache_key, None)
+        if not task.cancelled() and task.exception() is None:
+            self._response_cache.set(cache_key, task.result())  # type: ignore[union-attr]
+
+    def _cache_key(
+        self,
+        question: str,
+        query_type: QueryType,
+        context: str,
+        question_profile: str,
+        response_mode: AnswerMode,
+    ) -> bytes | None:
+        if self._response_cache is None:
+            return None
+        return response_key(
+            question=question,
+            query_type=query_type,
+            context=context,
+            question_profile=question_profile,
+            response_mode=response_mode,
+        )
+
+
+def _build_messages(
+    question: str,
+    query_type: QueryType,
+    context: str,
+    question_profile: str,
+    response_mode: AnswerMode,
+) -> list[dict[str, str]]:
+    user_prompt = _render_user_prompt(
+        {"question_profile": question_profile, "question": question, "context": context}
+    )
+    return [
+        {"role": "system", "content": _SYSTEM_CONTENT[query_type, response_mode]},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def _render_user_prompt(values: dict[str, str]) -> str:
+    pieces: list[str] = []
+    for literal, field in _USER_PROMPT_PARTS:
+        pieces.append(literal)
+        if field is not None:
+            pieces.append(values[field])
+    return "".join(pieces)
+
+
+def _remaining(deadline: float) -> float:
+    return max(0.0, deadline - asyncio.get_running_loop().time())
 
 
 def _mode_instruction(mode: AnswerMode) -> str:
@@ -322,3 +624,28 @@ def _mode_instruction(mode: AnswerMode) -> str:
         "- Provide balanced answer with short structure: conclusion + explanation + practice.\n"
         "- Avoid unnecessary verbosity."
     )
+
+
+# Stripped and split into (literal, field) pairs once, so rendering is a join instead of
+# str.format re-parsing the template and stripping the rendered prompt on every request.
+_USER_PROMPT_PARTS: tuple[tuple[str, str | None], ...] = tuple(
+    (literal, field)
+    for literal, field, _, _ in string.Formatter().parse(USER_PROMPT_TEMPLATE.strip())
+)
+
+# Volatile inputs live only in the user message, so requests sharing a query type and
+# mode send a byte-identical system prefix that API and llama.cpp prefix caches can reuse.
+_SYSTEM_CONTENT: dict[tuple[QueryType, AnswerMode], str] = {
+    (query_type, mode): "\n\n".join(
+        (
+            SYSTEM_PROMPT.strip(),
+            RESPONSE_FRAMING_TEMPLATE.format(
+                query_type=query_type.value,
+                response_mode=mode.value,
+                mode_instruction=_mode_instruction(mode),
+            ).strip(),
+        )
+    )
+    for query_type in QueryType
+    for mode in AnswerMode
+}
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import re
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 
 import httpx
 
@@ -27,6 +30,22 @@ MARKET_KEYWORDS = {
     "\u043a\u043e\u043d\u043a\u0443\u0440\u0435\u043d\u0442",
 }
 
+PRICE_ANCHORS = (
+    "price",
+    "pricing",
+    "\u0446\u0435\u043d",
+    "\u0441\u0442\u043e\u0438\u043c",
+    "\u0442\u0430\u0440\u0438\u0444",
+)
+PRICE_NUMBER_PATTERN = re.compile(r"\b\d{2,7}(?:[.,]\d{1,2})?\b")
+
+# Daily closes barely move within minutes; failed fetches are retried sooner.
+SNAPSHOT_TTL_SEC = 300
+EMPTY_SNAPSHOT_TTL_SEC = 30
+STOOQ_HEDGE_DELAY_SEC = 0.15
+# About one month of trading days.
+STOOQ_WINDOW_ROWS = 22
+
 
 @dataclass(slots=True)
 class MarketTickerSnapshot:
@@ -46,9 +65,23 @@ class MarketIntelService:
         self._timeout_sec = timeout_sec
         self._default_tickers = ("CRWD", "PANW", "FTNT", "CHKP")
         self._base_url = "https://query1.finance.yahoo.com/v8/finance/chart"
+        # Long-lived so Yahoo/Stooq connections are kept alive across questions.
+        self._client = httpx.AsyncClient(
+            timeout=timeout_sec,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        )
+        self._snapshot_cache: dict[tuple[str, ...], tuple[float, list[MarketTickerSnapshot]]] = {}
+        self._snapshot_fetches: dict[tuple[str, ...], asyncio.Task[list[MarketTickerSnapshot]]] = {}
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        await self._client.aclose()
 
     def should_enrich(self, question: str) -> bool:
         """Return true if question likely asks market comparison."""
+        if not question:
+            return False
         q = question.lower()
         return any(keyword in q for keyword in MARKET_KEYWORDS)
 
@@ -57,7 +90,7 @@ class MarketIntelService:
         if not self._enabled or not self.should_enrich(question):
             return None
 
-        snapshots = await self._fetch_snapshots(self._default_tickers)
+        snapshots = await self._cached_snapshots(self._default_tickers)
         internal_price = self._extract_internal_price(hits)
 
         lines = ["Market comparison (auto):"]
@@ -97,10 +130,34 @@ class MarketIntelService:
         )
         return "\n".join(lines)
 
+    async def _cached_snapshots(self, tickers: tuple[str, ...]) -> list[MarketTickerSnapshot]:
+        key = tuple(sorted(tickers))
+        cached = self._snapshot_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        task = self._snapshot_fetches.get(key)
+        if task is None:
+            # Concurrent questions wait for one in-flight fetch instead of each hitting Yahoo.
+            task = asyncio.create_task(self._fetch_snapshots(tickers))
+            self._snapshot_fetches[key] = task
+            task.add_done_callback(partial(self._store_snapshots, key))
+        return await asyncio.shield(task)
+
+    def _store_snapshots(
+        self,
+        key: tuple[str, ...],
+        task: asyncio.Task[list[MarketTickerSnapshot]],
+    ) -> None:
+        self._snapshot_fetches.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        snapshots = task.result()
+        ttl = SNAPSHOT_TTL_SEC if snapshots else EMPTY_SNAPSHOT_TTL_SEC
+        self._snapshot_cache[key] = (time.monotonic() + ttl, snapshots)
+
     async def _fetch_snapshots(self, tickers: tuple[str, ...]) -> list[MarketTickerSnapshot]:
-        async with httpx.AsyncClient(timeout=self._timeout_sec) as client:
-            tasks = [self._fetch_one(client, ticker) for ticker in tickers]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [self._fetch_one(self._client, ticker) for ticker in tickers]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         snapshots: list[MarketTickerSnapshot] = []
         for result in results:
             if isinstance(result, MarketTickerSnapshot):
@@ -112,13 +169,26 @@ class MarketIntelService:
         client: httpx.AsyncClient,
         ticker: str,
     ) -> MarketTickerSnapshot | None:
+        yahoo = asyncio.create_task(self._fetch_one_yahoo(client=client, ticker=ticker))
+        pending = {yahoo}
         try:
-            snapshot = await self._fetch_one_yahoo(client=client, ticker=ticker)
-            if snapshot is not None:
-                return snapshot
-            return await self._fetch_one_stooq(client=client, ticker=ticker)
-        except Exception:  # noqa: BLE001
+            # Hedged request: Stooq only starts if Yahoo fails or is slow, then the first valid answer wins.
+            done, pending = await asyncio.wait(pending, timeout=STOOQ_HEDGE_DELAY_SEC)
+            if done:
+                snapshot = _task_snapshot(yahoo)
+                if snapshot is not None:
+                    return snapshot
+            pending.add(asyncio.create_task(self._fetch_one_stooq(client=client, ticker=ticker)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    snapshot = _task_snapshot(task)
+                    if snapshot is not None:
+                        return snapshot
             return None
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def _fetch_one_yahoo(
         self,
@@ -159,31 +229,29 @@ class MarketIntelService:
         ticker: str,
     ) -> MarketTickerSnapshot | None:
         stooq_symbol = f"{ticker.lower()}.us"
-        response = await client.get(
+        # The CSV holds the full daily history; stream it and keep only the trailing window.
+        window: deque[float] = deque(maxlen=STOOQ_WINDOW_ROWS)
+        async with client.stream(
+            "GET",
             "https://stooq.com/q/d/l/",
             params={"s": stooq_symbol, "i": "d"},
-        )
-        if response.status_code >= 400:
-            return None
-
-        rows = response.text.strip().splitlines()
-        if len(rows) < 3:
-            return None
-
-        closes: list[float] = []
-        for row in rows[1:]:
-            parts = row.split(",")
-            if len(parts) < 5:
-                continue
-            try:
-                closes.append(float(parts[4]))
-            except ValueError:
-                continue
+        ) as response:
+            if response.status_code >= 400:
+                return None
+            rows = response.aiter_lines()
+            await anext(rows, None)  # header
+            async for row in rows:
+                parts = row.split(",", 5)
+                if len(parts) < 5:
+                    continue
+                try:
+                    window.append(float(parts[4]))
+                except ValueError:
+                    continue
 
-        if len(closes) < 3:
+        if len(window) < 3:
             return None
 
-        window = closes[-22:] if len(closes) > 22 else closes
         first_close = window[0]
         last_close = window[-1]
         return_30d = ((last_close - first_close) / first_close) * 100.0
@@ -195,21 +263,13 @@ class MarketIntelService:
         )
 
     def _extract_internal_price(self, hits: list[SearchHit]) -> float | None:
-        number_pattern = re.compile(r"\b\d{2,7}(?:[.,]\d{1,2})?\b")
-        anchors = (
-            "price",
-            "pricing",
-            "\u0446\u0435\u043d",
-            "\u0441\u0442\u043e\u0438\u043c",
-            "\u0442\u0430\u0440\u0438\u0444",
-        )
-
         for hit in hits[:5]:
             text = hit.text.lower()
-            if not any(anchor in text for anchor in anchors):
+            if not any(anchor in text for anchor in PRICE_ANCHORS):
                 continue
-            for raw_number in number_pattern.findall(text):
-                number = raw_number.replace(",", ".")
+            # finditer stops at the first plausible value instead of collecting every number.
+            for match in PRICE_NUMBER_PATTERN.finditer(text):
+                number = match.group().replace(",", ".")
                 try:
                     value = float(number)
                 except ValueError:
@@ -244,3 +304,9 @@ class MarketIntelService:
             '    y-axis "Value" 0 --> 1000000\n'
             f"    bar [{internal_value:.2f}]"
         )
+
+
+def _task_snapshot(task: asyncio.Task[MarketTickerSnapshot | None]) -> MarketTickerSnapshot | None:
+    if task.cancelled() or task.exception() is not None:
+        return None
+    return task.result()
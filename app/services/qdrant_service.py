@@ -2,14 +2,43 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID
 
 from qdrant_client import AsyncQdrantClient, models
 
+from app.core.batching import MicroBatcher
 from app.core.exceptions import QdrantUnavailableError
 from app.models.schemas import ChunkRecord, SearchHit
 
+# Payload fields searches and soft deletes filter on; indexed so filtered HNSW traversal
+# can skip non-matching points instead of checking payloads one by one.
+PAYLOAD_INDEXES: tuple[tuple[str, models.PayloadSchemaType], ...] = (
+    ("is_active", models.PayloadSchemaType.BOOL),
+    ("version", models.PayloadSchemaType.KEYWORD),
+    ("document_name", models.PayloadSchemaType.KEYWORD),
+)
+
+UPSERT_BATCH_SIZE = 256
+
+INACTIVE_CONDITION = models.FieldCondition(
+    key="is_active",
+    match=models.MatchValue(value=False),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class VectorQuery:
+    """One filtered vector search within a batch."""
+
+    query_vector: list[float]
+    top_k: int
+    version: str | None = None
+    document_names: list[str] | None = None
+
 
 class QdrantService:
     """Manage collection lifecycle, indexing, and search operations."""
@@ -22,17 +51,29 @@ class QdrantService:
         collection_name: str,
         timeout_sec: int,
         api_key: str | None = None,
+        hnsw_ef: int | None = None,
+        prefer_grpc: bool = True,
+        grpc_port: int = 6334,
     ) -> None:
         self._collection_name = collection_name
+        # None keeps the collection's default search beam width.
+        self._search_params = models.SearchParams(hnsw_ef=hnsw_ef, exact=False) if hnsw_ef else None
         self._mode = mode
         if mode == "local":
             path.mkdir(parents=True, exist_ok=True)
             self._client = AsyncQdrantClient(path=str(path), timeout=timeout_sec)
         else:
+            # gRPC sends vectors as packed floats over one multiplexed HTTP/2 connection.
             self._client = AsyncQdrantClient(
                 url=url,
                 api_key=api_key,
                 timeout=timeout_sec,
+                prefer_grpc=prefer_grpc,
+                grpc_port=grpc_port,
+                grpc_options={
+                    "grpc.keepalive_time_ms": 20_000,
+                    "grpc.keepalive_timeout_ms": 10_000,
+                },
             )
 
     async def healthcheck(self) -> None:
@@ -57,6 +98,7 @@ class QdrantService:
                     first_key = next(iter(vectors))
                     current_size = int(vectors[first_key].size)
                 if current_size == vector_size:
+                    await self._ensure_payload_indexes()
                     return
 
                 await self._client.delete_collection(self._collection_name)
@@ -81,25 +123,69 @@ class QdrantService:
                 raise QdrantUnavailableError(
                     "Failed to create Qdrant collection"
                 ) from exc
+            await self._ensure_payload_indexes()
+
+    async def _ensure_payload_indexes(self) -> None:
+        if self._mode == "local":
+            # Embedded Qdrant has no payload indexes and warns when asked for one.
+            return
+        for field_name, field_schema in PAYLOAD_INDEXES:
+            try:
+                await self._client.create_payload_index(
+                    collection_name=self._collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                    wait=True,
+                )
+            except Exception as exc:  # noqa: BLE001
+                raise QdrantUnavailableError(
+                    "Failed to create Qdrant payload index"
+                ) from exc
 
     async def upsert_chunks(
-        self, chunks: list[ChunkRecord], embeddings: list[list[float]]
+        self,
+        chunks: list[ChunkRecord],
+        embeddings: list[list[float]],
+        wait: bool = True,
     ) -> None:
-        """Upsert chunk vectors and metadata."""
-        points: list[models.PointStruct] = []
-        for chunk, vector in zip(chunks, embeddings):
-            point_id = chunk.metadata.get("chunk_id", str(uuid4()))
-            payload = {"text": chunk.text, **chunk.metadata}
-            points.append(models.PointStruct(id=point_id, vector=vector, payload=payload))
+        """Upsert chunk vectors and metadata.
+
+        Large inputs are sent as bounded requests. With ``wait`` only the last
+        request waits for indexing; Qdrant applies updates in order, so earlier
+        ones are applied by then.
+        """
+        last_start = max(0, len(chunks) - 1) // UPSERT_BATCH_SIZE * UPSERT_BATCH_SIZE
+        for start in range(0, len(chunks), UPSERT_BATCH_SIZE):
+            batch = chunks[start : start + UPSERT_BATCH_SIZE]
+            # Column-oriented batch: one model to validate instead of a PointStruct per chunk.
+            points = models.Batch(
+                ids=[chunk.metadata.get("chunk_id") or _derived_point_id(chunk) for chunk in batch],
+                vectors=embeddings[start : start + UPSERT_BATCH_SIZE],
+                payloads=[{"text": chunk.text, **chunk.metadata} for chunk in batch],
+            )
+            try:
+                await self._client.upsert(
+                    collection_name=self._collection_name,
+                    points=points,
+                    wait=wait and start == last_start,
+                )
+            except Exception as exc:  # noqa: BLE001
+                raise QdrantUnavailableError("Failed to upsert data into Qdrant") from exc
 
+    async def delete_chunks(self, chunks: list[ChunkRecord]) -> None:
+        """Best-effort removal of previously upserted chunk points."""
+        point_ids = [chunk.metadata["chunk_id"] for chunk in chunks if "chunk_id" in chunk.metadata]
+        if not point_ids:
+            return
         try:
-            await self._client.upsert(
+            await self._client.delete(
                 collection_name=self._collection_name,
-                points=points,
+                points_selector=models.PointIdsList(points=point_ids),
                 wait=True,
             )
-        except Exception as exc:  # noqa: BLE001
-            raise QdrantUnavailableError("Failed to upsert data into Qdrant") from exc
+        except Exception:  # noqa: BLE001
+            # Callers are already failing; keep their original error.
+            return
 
     async def search(
         self,
@@ -109,28 +195,12 @@ class QdrantService:
         document_names: list[str] | None = None,
     ) -> list[SearchHit]:
         """Return top-k active hits with optional version filtering."""
-        conditions = []
-        if version:
-            conditions.append(
-                models.FieldCondition(
-                    key="version",
-                    match=models.MatchValue(value=version),
-                )
-            )
-        if document_names:
-            conditions.append(
-                models.FieldCondition(
-                    key="document_name",
-                    match=models.MatchAny(any=document_names),
-                )
-            )
-        query_filter = models.Filter(must=conditions) if conditions else None
-
         try:
-            points = await self._client.search(
+            response = await self._client.query_points(
                 collection_name=self._collection_name,
-                query_vector=query_vector,
-                query_filter=query_filter,
+                query=query_vector,
+                query_filter=_build_filter(version, document_names),
+                search_params=self._search_params,
                 limit=top_k,
                 with_payload=True,
             )
@@ -138,22 +208,30 @@ class QdrantService:
             if "not found" in str(exc).lower():
                 return []
             raise QdrantUnavailableError("Failed to query Qdrant") from exc
+        return _to_hits(response.points)
 
-        hits: list[SearchHit] = []
-        for point in points:
-            payload = point.payload or {}
-            if payload.get("is_active", True) is False:
-                continue
-            text = str(payload.get("text", ""))
-            hits.append(
-                SearchHit(
-                    id=str(point.id),
-                    score=float(point.score),
-                    text=text,
-                    metadata=payload,
-                )
+    async def search_many(self, queries: Sequence[VectorQuery]) -> list[list[SearchHit]]:
+        """Run several filtered searches in one Qdrant request, preserving order."""
+        requests = [
+            models.QueryRequest(
+                query=query.query_vector,
+                filter=_build_filter(query.version, query.document_names),
+                params=self._search_params,
+                limit=query.top_k,
+                with_payload=True,
             )
-        return hits
+            for query in queries
+        ]
+        try:
+            responses = await self._client.query_batch_points(
+                collection_name=self._collection_name,
+                requests=requests,
+            )
+        except Exception as exc:  # noqa: BLE001
+            if "not found" in str(exc).lower():
+                return [[] for _ in queries]
+            raise QdrantUnavailableError("Failed to query Qdrant") from exc
+        return [_to_hits(response.points) for response in responses]
 
     async def soft_delete(
         self,
@@ -194,3 +272,96 @@ class QdrantService:
             return int(result.operation_id or 0)
         except Exception as exc:  # noqa: BLE001
             raise QdrantUnavailableError("Failed to soft-delete vectors") from exc
+
+
+class VectorSearchBatcher(MicroBatcher[VectorQuery, list[SearchHit]]):
+    """Drop-in ``search`` that coalesces concurrent queries into one batch request."""
+
+    def __init__(
+        self,
+        qdrant_service: QdrantService,
+        max_batch: int = 16,
+        max_wait_ms: int = 5,
+    ) -> None:
+        super().__init__(max_batch=max_batch, max_wait_ms=max_wait_ms)
+        self._qdrant_service = qdrant_service
+
+    async def search(
+        self,
+        query_vector: list[float],
+        top_k: int,
+        version: str | None = None,
+        document_names: list[str] | None = None,
+    ) -> list[SearchHit]:
+        """Return top-k active hits with optional version filtering."""
+        return await self.submit(
+            VectorQuery(
+                query_vector=query_vector,
+                top_k=top_k,
+                version=version,
+                document_names=document_names,
+            )
+        )
+
+    async def _process(self, items: list[VectorQuery]) -> list[list[SearchHit]]:
+        if len(items) == 1:
+            query = items[0]
+            return [
+                await self._qdrant_service.search(
+                    query_vector=query.query_vector,
+                    top_k=query.top_k,
+                    version=query.version,
+                    document_names=query.document_names,
+                )
+            ]
+        return await self._qdrant_service.search_many(items)
+
+
+def _build_filter(version: str | None, document_names: list[str] | None) -> models.Filter:
+    conditions = []
+    if version:
+        conditions.append(
+            models.FieldCondition(
+                key="version",
+                match=models.MatchValue(value=version),
+            )
+        )
+    if document_names:
+        conditions.append(
+            models.FieldCondition(
+                key="document_name",
+                match=models.MatchAny(any=document_names),
+            )
+        )
+    # must_not rather than must(is_active=True): points without the flag still count as active.
+    return models.Filter(must=conditions or None, must_not=[INACTIVE_CONDITION])
+
+
+def _derived_point_id(chunk: ChunkRecord) -> str:
+    # Stable for the same chunk, so re-upserting it overwrites the point instead of duplicating it.
+    metadata = chunk.metadata
+    key = "\x1f".join(
+        (
+            str(metadata.get("document_name", "")),
+            str(metadata.get("version", "")),
+            str(metadata.get("chunk_order", "")),
+            chunk.text,
+        )
+    )
+    return str(UUID(bytes=hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()))
+
+
+def _to_hits(points: Sequence[models.ScoredPoint]) -> list[SearchHit]:
+    hits: list[SearchHit] = []
+    for point in points:
+        payload = point.payload or {}
+        text = str(payload.get("text", ""))
+        hits.append(
+            SearchHit(
+                id=str(point.id),
+                score=float(point.score),
+                text=text,
+                metadata=payload,
+            )
+        )
+    return hits
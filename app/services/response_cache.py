@@ -0,0 +1,52 @@
+"""In-process TTL cache for generated LLM answers."""
+
+from __future__ import annotations
+
+import hashlib
+
+from cachetools import TTLCache
+
+from app.models.schemas import AnswerMode, LLMResult, QueryType
+
+# Above this sampling temperature repeated prompts are expected to vary, so answers are not reused.
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+
+
+class ResponseCache:
+    """Cache-aside store mapping prompt inputs to generated answers.
+
+    Keys cover the retrieved context verbatim, so re-indexed or soft-deleted
+    documents change the key instead of serving stale answers.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl_sec: int = 3600) -> None:
+        self._cache: TTLCache[bytes, LLMResult] = TTLCache(maxsize=maxsize, ttl=ttl_sec)
+
+    def get(self, key: bytes) -> LLMResult | None:
+        """Return cached answer for key while it is alive."""
+        return self._cache.get(key)
+
+    def set(self, key: bytes, result: LLMResult) -> None:
+        """Store generated answer for key."""
+        self._cache[key] = result
+
+
+def response_key(
+    question: str,
+    query_type: QueryType,
+    context: str,
+    question_profile: str,
+    response_mode: AnswerMode,
+) -> bytes:
+    """Return digest of everything that shapes the prompt."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        " ".join(question.split()),
+        query_type.value,
+        response_mode.value,
+        question_profile,
+        context,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.digest()
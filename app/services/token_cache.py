@@ -0,0 +1,52 @@
+"""In-process TTL cache for resolved bearer-token sessions."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+
+from cachetools import TTLCache
+
+from app.core.constants import UTC_TIMEZONE
+from app.services.auth_service import AuthUser
+
+
+class TokenCache:
+    """Cache-aside store mapping token digests to authenticated users.
+
+    Only used from the event loop and no method awaits mid-update, so the
+    cache needs no lock.
+    """
+
+    def __init__(self, maxsize: int = 8192, ttl_sec: int = 60) -> None:
+        self._cache: TTLCache[bytes, AuthUser] = TTLCache(maxsize=maxsize, ttl=ttl_sec)
+
+    async def get(self, token: str) -> AuthUser | None:
+        """Return cached user while both cache entry and session are alive."""
+        key = _token_key(token)
+        user = self._cache.get(key)
+        if user is None:
+            return None
+        expires_at = user.session_expires_at
+        if expires_at is not None and expires_at <= datetime.now(tz=UTC_TIMEZONE):
+            self._cache.pop(key, None)
+            return None
+        return user
+
+    async def set(self, token: str, user: AuthUser) -> None:
+        """Store resolved user for token."""
+        self._cache[_token_key(token)] = user
+
+    async def pop(self, token: str) -> None:
+        """Drop cached session for token."""
+        self._cache.pop(_token_key(token), None)
+
+    async def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached session that belongs to user."""
+        stale_keys = [key for key, user in self._cache.items() if user.id == user_id]
+        for key in stale_keys:
+            self._cache.pop(key, None)
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
@@ -580,15 +580,9 @@ async function sendQuestion(question) {
   }
 
   try {
-    const result = await apiRequest(
-      "/ask",
-      {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify(payload),
-      },
-      true
-    );
+    const result = await streamAnswer(payload, (partialText) => {
+      if (getActiveSession() === session) renderStreamingText(partialText);
+    });
 
     pending.text = result.answer || "";
     if (settings.showConfidence) {
@@ -609,6 +603,86 @@ async function sendQuestion(question) {
   renderMessages();
 }
 
+async function streamAnswer(payload, onDelta) {
+  if (!authToken) throw new Error("Требуется авторизация");
+  const response = await fetch("/ask/stream", {
+    method: "POST",
+    headers: { "Content-Type": "application/json", Authorization: `Bearer ${authToken}` },
+    body: JSON.stringify(payload),
+  });
+
+  if (!response.ok || !response.body) {
+    if (response.status === 401) {
+      clearAuth();
+      openAuthModal();
+    }
+    let detail = "";
+    try {
+      detail = (await response.json())?.detail || "";
+    } catch (_) {
+      detail = "";
+    }
+    throw new Error(detail || `HTTP ${response.status}`);
+  }
+
+  // Server-sent events: "delta" pieces are provisional, "done" carries the validated answer.
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let partialText = "";
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary = buffer.indexOf("\n\n");
+    while (boundary !== -1) {
+      const event = parseServerEvent(buffer.slice(0, boundary));
+      buffer = buffer.slice(boundary + 2);
+      if (event.name === "delta") {
+        partialText += event.data?.text || "";
+        onDelta(partialText);
+      } else if (event.name === "done") {
+        return event.data || {};
+      } else if (event.name === "error") {
+        throw new Error(event.data?.detail || "Ошибка ответа");
+      }
+      boundary = buffer.indexOf("\n\n");
+    }
+  }
+  throw new Error("Ответ прерван");
+}
+
+function parseServerEvent(rawEvent) {
+  let name = "message";
+  const dataLines = [];
+  rawEvent.split("\n").forEach((line) => {
+    if (line.startsWith("event:")) name = line.slice(6).trim();
+    else if (line.startsWith("data:")) dataLines.push(line.slice(5).trimStart());
+  });
+  let data = null;
+  try {
+    data = dataLines.length ? JSON.parse(dataLines.join("\n")) : null;
+  } catch (_) {
+    data = null;
+  }
+  return { name, data };
+}
+
+function renderStreamingText(text) {
+  // Only the pending bubble changes while streaming; full re-render happens once the answer is final.
+  const bubbles = messagesNode.querySelectorAll(".msg.assistant .bubble");
+  const bubble = bubbles[bubbles.length - 1];
+  if (!bubble) return;
+  bubble.innerHTML = "";
+  const textNode = document.createElement("div");
+  textNode.className = "bubble-text";
+  textNode.textContent = text;
+  bubble.appendChild(textNode);
+  messagesNode.scrollTop = messagesNode.scrollHeight;
+  syncThinkingTimer();
+}
+
 async function shareCurrentChat() {
   const session = getActiveSession();
   if (!session || session.messages.length === 0) {
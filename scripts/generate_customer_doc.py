@@ -1,65 +1,108 @@
 from __future__ import annotations
 
 from datetime import date
+from io import BytesIO
 from pathlib import Path
 
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
+from docx.oxml.styles import styleId_from_name
+from docx.oxml.table import CT_Tbl
 from docx.shared import Pt
 
+BODY_FONT = "Times New Roman"
+CODE_FONT = "Consolas"
+BODY_STYLE = "Body TNR"
+CODE_STYLE = "Code Consolas"
+LIST_STYLE = "List Number"
+TABLE_STYLE = "Table Grid"
+# Qualified rFonts attribute names, resolved once instead of per run.
+_FONT_ATTRS = (qn("w:ascii"), qn("w:hAnsi"), qn("w:eastAsia"), qn("w:cs"))
 
-def set_base_font(document: Document, font_name: str = "Times New Roman", size: int = 12) -> None:
+
+def _apply_font(element, font_name: str) -> None:
+    r_pr = element.get_or_add_rPr()
+    # Replaces theme font references too (built-in headings use them), which would win over names.
+    r_pr._remove_rFonts()
+    r_fonts = r_pr._add_rFonts()
+    for attr in _FONT_ATTRS:
+        r_fonts.set(attr, font_name)
+
+
+def set_base_font(document: Document, font_name: str = BODY_FONT, size: int = 12) -> None:
     style = document.styles["Normal"]
-    style.font.name = font_name
     style.font.size = Pt(size)
-    style._element.rPr.rFonts.set(qn("w:ascii"), font_name)
-    style._element.rPr.rFonts.set(qn("w:hAnsi"), font_name)
-    style._element.rPr.rFonts.set(qn("w:eastAsia"), font_name)
-    style._element.rPr.rFonts.set(qn("w:cs"), font_name)
+    _apply_font(style.element, font_name)
+
+
+def register_styles(document: Document) -> None:
+    # Fonts and spacing live on styles once, so paragraphs and runs carry no direct formatting.
+    styles = document.styles
+    for level in range(1, 4):
+        _apply_font(styles[f"Heading {level}"].element, BODY_FONT)
+    styles[LIST_STYLE].paragraph_format.space_after = Pt(4)
+
+    body = styles.add_style(BODY_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    body.base_style = styles["Normal"]
+    body.paragraph_format.space_after = Pt(6)
+
+    code = styles.add_style(CODE_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    code.base_style = styles["Normal"]
+    code.font.size = Pt(10)
+    _apply_font(code.element, CODE_FONT)
+    code.paragraph_format.space_after = Pt(8)
+
+
+def _new_paragraph(style_name: str, text: str, bold: bool = False):
+    # Raw <w:p> with a style id: skips python-docx's per-paragraph style-name resolution.
+    paragraph = OxmlElement("w:p")
+    paragraph.style = styleId_from_name(style_name)
+    run = paragraph.add_r()
+    run.text = text
+    if bold:
+        run.get_or_add_rPr()._add_b()
+    return paragraph
+
+
+def _append(document: Document, *paragraphs) -> None:
+    sect_pr = document.element.body.sectPr
+    for paragraph in paragraphs:
+        sect_pr.addprevious(paragraph)
 
 
 def add_heading(document: Document, text: str, level: int = 1) -> None:
-    paragraph = document.add_heading(text, level=level)
-    for run in paragraph.runs:
-        run.font.name = "Times New Roman"
-        run._element.rPr.rFonts.set(qn("w:eastAsia"), "Times New Roman")
-        run._element.rPr.rFonts.set(qn("w:cs"), "Times New Roman")
+    _append(document, _new_paragraph(f"Heading {level}", text))
 
 
 def add_paragraph(document: Document, text: str, bold: bool = False) -> None:
-    paragraph = document.add_paragraph()
-    run = paragraph.add_run(text)
-    run.bold = bold
-    run.font.name = "Times New Roman"
-    run._element.rPr.rFonts.set(qn("w:eastAsia"), "Times New Roman")
-    run._element.rPr.rFonts.set(qn("w:cs"), "Times New Roman")
-    paragraph.paragraph_format.space_after = Pt(6)
+    _append(document, _new_paragraph(BODY_STYLE, text, bold=bold))
 
 
 def add_list(document: Document, items: list[str]) -> None:
-    for item in items:
-        paragraph = document.add_paragraph(style="List Number")
-        run = paragraph.add_run(item)
-        run.font.name = "Times New Roman"
-        run._element.rPr.rFonts.set(qn("w:eastAsia"), "Times New Roman")
-        run._element.rPr.rFonts.set(qn("w:cs"), "Times New Roman")
-        paragraph.paragraph_format.space_after = Pt(4)
+    _append(document, *(_new_paragraph(LIST_STYLE, item) for item in items))
 
 
 def add_code_block(document: Document, text: str) -> None:
-    paragraph = document.add_paragraph()
-    run = paragraph.add_run(text)
-    run.font.name = "Consolas"
-    run.font.size = Pt(10)
-    run._element.rPr.rFonts.set(qn("w:eastAsia"), "Consolas")
-    run._element.rPr.rFonts.set(qn("w:cs"), "Consolas")
-    paragraph.paragraph_format.space_after = Pt(8)
+    _append(document, _new_paragraph(CODE_STYLE, text))
+
+
+def add_table(document: Document, rows: list[tuple[str, ...]], style_name: str = TABLE_STYLE) -> None:
+    # Whole <w:tbl> in one parse; filling it through table.cell()/add_row() recomputes the cell grid.
+    table = CT_Tbl.new_tbl(len(rows), len(rows[0]), document._block_width)
+    table.tblStyle_val = styleId_from_name(style_name)
+    for tr, values in zip(table.tr_lst, rows):
+        for tc, value in zip(tr.tc_lst, values):
+            tc.p_lst[0].add_r().text = value
+    _append(document, table)
 
 
 def build_document() -> Document:
     doc = Document()
     set_base_font(doc)
+    register_styles(doc)
 
     section = doc.sections[0]
     section.top_margin = Pt(56)
@@ -72,24 +115,15 @@ def build_document() -> Document:
     run = title.add_run("ТЕХНИЧЕСКИЙ ДОКУМЕНТ")
     run.bold = True
     run.font.size = Pt(16)
-    run.font.name = "Times New Roman"
-    run._element.rPr.rFonts.set(qn("w:eastAsia"), "Times New Roman")
-    run._element.rPr.rFonts.set(qn("w:cs"), "Times New Roman")
 
     subtitle = doc.add_paragraph()
     subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
     sub_run = subtitle.add_run("Пилотный прототип ИИ-агента для поддержки продаж и технических подразделений")
     sub_run.font.size = Pt(13)
-    sub_run.font.name = "Times New Roman"
-    sub_run._element.rPr.rFonts.set(qn("w:eastAsia"), "Times New Roman")
-    sub_run._element.rPr.rFonts.set(qn("w:cs"), "Times New Roman")
 
     meta = doc.add_paragraph()
     meta.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    m_run = meta.add_run(f"Дата: {date.today().strftime('%d.%m.%Y')}   |   Версия: 1.0")
-    m_run.font.name = "Times New Roman"
-    m_run._element.rPr.rFonts.set(qn("w:eastAsia"), "Times New Roman")
-    m_run._element.rPr.rFonts.set(qn("w:cs"), "Times New Roman")
+    meta.add_run(f"Дата: {date.today().strftime('%d.%m.%Y')}   |   Версия: 1.0")
 
     doc.add_page_break()
 
@@ -319,24 +353,14 @@ def build_document() -> Document:
         "Расчет выполнен для API-подключения при среднем запросе: "
         "2500 входных токенов и 550 выходных токенов.",
     )
-    table = doc.add_table(rows=1, cols=6)
-    table.style = "Table Grid"
-    hdr = table.rows[0].cells
-    hdr[0].text = "Объем"
-    hdr[1].text = "Входные токены"
-    hdr[2].text = "Выходные токены"
-    hdr[3].text = "Стоимость input"
-    hdr[4].text = "Стоимость output"
-    hdr[5].text = "Итого"
-
-    rows = [
-        ("100 запросов", "250 000", "55 000", "$0.0375", "$0.0330", "$0.0705"),
-        ("1000 запросов", "2 500 000", "550 000", "$0.3750", "$0.3300", "$0.7050"),
-    ]
-    for values in rows:
-        cells = table.add_row().cells
-        for idx, value in enumerate(values):
-            cells[idx].text = value
+    add_table(
+        doc,
+        [
+            ("Объем", "Входные токены", "Выходные токены", "Стоимость input", "Стоимость output", "Итого"),
+            ("100 запросов", "250 000", "55 000", "$0.0375", "$0.0330", "$0.0705"),
+            ("1000 запросов", "2 500 000", "550 000", "$0.3750", "$0.3300", "$0.7050"),
+        ],
+    )
 
     add_paragraph(
         doc,
@@ -406,7 +430,10 @@ def main() -> None:
     output_path = output_dir / "Технический_документ_Пилот_RAG_для_заказчика.docx"
 
     document = build_document()
-    document.save(output_path)
+    # Zip the package in memory and write it with one call instead of per-member writes.
+    buffer = BytesIO()
+    document.save(buffer)
+    output_path.write_bytes(buffer.getbuffer())
     print(output_path.resolve())
 
 
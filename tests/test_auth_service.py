@@ -0,0 +1,87 @@
+"""Tests for auth persistence on databases created by earlier releases."""
+
+import asyncio
+import hashlib
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from app.core.constants import UTC_TIMEZONE
+from app.services.auth_service import AuthService
+
+LEGACY_SCHEMA = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL UNIQUE,
+    display_name TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    password_salt TEXT NOT NULL,
+    settings_json TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE sessions (
+    token TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    expires_at TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+"""
+
+
+def _create_legacy_db(db_path: Path) -> None:
+    now = datetime.now(tz=UTC_TIMEZONE)
+    salt = "legacy-salt"
+    # Earlier releases stored the PBKDF2 digest as hex and session expiry as an ISO timestamp.
+    password_hash = hashlib.pbkdf2_hmac(
+        "sha256", b"correct-horse", salt.encode("utf-8"), 120_000
+    ).hex()
+    with sqlite3.connect(db_path) as connection:
+        connection.executescript(LEGACY_SCHEMA)
+        connection.execute(
+            """
+            INSERT INTO users (email, display_name, password_hash, password_salt, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            ("old@example.com", "Old User", password_hash, salt, now.isoformat()),
+        )
+        connection.executemany(
+            "INSERT INTO sessions (token, user_id, expires_at, created_at) VALUES (?, 1, ?, ?)",
+            [
+                ("live-token", (now + timedelta(hours=1)).isoformat(), now.isoformat()),
+                ("expired-token", (now - timedelta(hours=1)).isoformat(), now.isoformat()),
+            ],
+        )
+
+
+def test_legacy_database_is_migrated_and_sessions_still_validate(tmp_path: Path) -> None:
+    db_path = tmp_path / "app.db"
+    _create_legacy_db(db_path)
+    service = AuthService(db_path=db_path)
+
+    live_user = asyncio.run(service.get_user_by_token("live-token"))
+    expired_user = asyncio.run(service.get_user_by_token("expired-token"))
+
+    assert live_user is not None
+    assert live_user.email == "old@example.com"
+    assert live_user.session_expires_at is not None
+    assert live_user.session_expires_at > datetime.now(tz=UTC_TIMEZONE)
+    assert expired_user is None
+
+
+def test_legacy_password_hash_still_logs_in(tmp_path: Path) -> None:
+    db_path = tmp_path / "app.db"
+    _create_legacy_db(db_path)
+    service = AuthService(db_path=db_path)
+
+    token, user = asyncio.run(service.login(" Old@Example.com ", "correct-horse"))
+    resolved = asyncio.run(service.get_user_by_token(token))
+
+    assert user.display_name == "Old User"
+    assert resolved is not None
+    assert resolved.id == user.id
+    with pytest.raises(ValueError):
+        asyncio.run(service.login("old@example.com", "wrong-password"))
@@ -38,3 +38,30 @@ def test_market_enrichment_disabled_for_non_market_question() -> None:
     service = StubMarketIntelService(enabled=True)
     block = asyncio.run(service.build_market_block("Как включить функцию?", []))
     assert block is None
+
+
+class CountingMarketIntelService(StubMarketIntelService):
+    """Stub service that counts upstream snapshot fetches."""
+
+    fetches = 0
+
+    async def _fetch_snapshots(self, tickers: tuple[str, ...]):  # type: ignore[override]
+        self.fetches += 1
+        await asyncio.sleep(0)
+        return await super()._fetch_snapshots(tickers)
+
+
+def test_market_snapshots_are_cached_between_questions() -> None:
+    service = CountingMarketIntelService(enabled=True)
+
+    async def ask_many() -> list:
+        blocks = await asyncio.gather(
+            *(service.build_market_block("Сравни с рынком", []) for _ in range(3))
+        )
+        blocks.append(await service.build_market_block("market price?", []))
+        return blocks
+
+    blocks = asyncio.run(ask_many())
+
+    assert all(block is not None and "CRWD" in block for block in blocks)
+    assert service.fetches == 1
@@ -0,0 +1,29 @@
+"""Tests for document parser output."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from app.ingestion.parsers import DocumentParser
+
+
+def test_xlsx_rows_keep_cell_formatting(tmp_path: Path) -> None:
+    path = tmp_path / "prices.xlsx"
+    pd.DataFrame(
+        {
+            "Date": [datetime(2024, 1, 1), datetime(2024, 2, 15)],
+            "Qty": [3, 4],
+            "Price": [1.5, 2.25],
+            "Note": ["first   item", None],
+        }
+    ).to_excel(path, sheet_name="Prices", index=False)
+
+    elements = DocumentParser().parse(path)
+
+    assert len(elements) == 1
+    assert elements[0].section == "sheet_Prices"
+    assert elements[0].text == (
+        "Date: 2024-01-01 00:00:00; Qty: 3; Price: 1.5; Note: first item\n"
+        "Date: 2024-02-15 00:00:00; Qty: 4; Price: 2.25; Note:"
+    )
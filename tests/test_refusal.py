@@ -52,3 +52,29 @@ def test_refusal_when_no_retrieved_context() -> None:
     assert response.answer == REFUSAL_TEXT
     assert response.sources == []
     assert response.confidence == 0.0
+
+
+class FailingRetriever:
+    """Must not be called for questions refused up front."""
+
+    async def retrieve(
+        self,
+        question: str,
+        version: str | None = None,
+        document_names: list[str] | None = None,
+    ) -> RetrievalResult:
+        raise AssertionError("Retriever should not be called for a blank question")
+
+
+def test_refusal_for_blank_question_skips_retrieval() -> None:
+    service = RAGService(
+        retriever=FailingRetriever(),  # type: ignore[arg-type]
+        llm_service=DummyLLM(),  # type: ignore[arg-type]
+        citation_validator=CitationValidator(max_sources=3),
+        market_intel_service=DummyMarketIntel(),  # type: ignore[arg-type]
+    )
+
+    for question in ("   ", "?!", " ok "):
+        response = asyncio.run(service.ask(question, QueryType.sales))
+        assert response.answer == REFUSAL_TEXT
+        assert response.sources == []
@@ -2,10 +2,36 @@
 
 import asyncio
 
-from app.models.schemas import AnswerMode, LLMResult, QueryType, SearchHit
+from app.models.schemas import AnswerMode, AskResponse, LLMResult, QueryType, SearchHit
 from app.rag.citation import CitationValidator
 from app.rag.generator import RAGService
 from app.rag.retriever import RetrievalResult
+from app.services.llm_service import LLMService
+from app.services.response_cache import ResponseCache
+
+
+FIXED_RETRIEVAL = RetrievalResult(
+    hits=[
+        SearchHit(
+            id="1",
+            score=0.87,
+            text="AstroSecure 5000 supports role-based access control and audit logs.",
+            metadata={
+                "document_name": "spec.docx",
+                "version": "v1",
+                "page_number": 2,
+                "section": "Security",
+            },
+        )
+    ],
+    confidence=0.87,
+)
+FIXED_LLM_RESULT = LLMResult(
+    answer=(
+        "Система поддерживает RBAC и аудит действий пользователей. "
+        "Это снижает риски несанкционированного доступа."
+    )
+)
 
 
 class FixedRetriever:
@@ -17,22 +43,7 @@ class FixedRetriever:
         version: str | None = None,
         document_names: list[str] | None = None,
     ) -> RetrievalResult:
-        return RetrievalResult(
-            hits=[
-                SearchHit(
-                    id="1",
-                    score=0.87,
-                    text="AstroSecure 5000 supports role-based access control and audit logs.",
-                    metadata={
-                        "document_name": "spec.docx",
-                        "version": "v1",
-                        "page_number": 2,
-                        "section": "Security",
-                    },
-                )
-            ],
-            confidence=0.87,
-        )
+        return FIXED_RETRIEVAL
 
 
 class FixedLLM:
@@ -46,12 +57,7 @@ class FixedLLM:
         question_profile: str = "",
         response_mode: AnswerMode = AnswerMode.standard,
     ) -> LLMResult:
-        return LLMResult(
-            answer=(
-                "Система поддерживает RBAC и аудит действий пользователей. "
-                "Это снижает риски несанкционированного доступа."
-            )
-        )
+        return FIXED_LLM_RESULT
 
 
 class DummyMarketIntel:
@@ -91,3 +97,81 @@ def test_deep_mode_adds_context_details_for_short_answer() -> None:
         )
     )
     assert "Дополнительно из контекста" in response.answer
+
+
+class StreamingLLM(FixedLLM):
+    """Streams fixed answer text in pieces."""
+
+    async def answer_stream(
+        self,
+        question: str,
+        query_type: QueryType,
+        context: str,
+        question_profile: str = "",
+        response_mode: AnswerMode = AnswerMode.standard,
+    ):
+        for piece in ("Система поддерживает ", "RBAC ", "и аудит."):
+            yield piece
+
+
+def test_ask_stream_yields_pieces_then_validated_response() -> None:
+    service = RAGService(
+        retriever=FixedRetriever(),  # type: ignore[arg-type]
+        llm_service=StreamingLLM(),  # type: ignore[arg-type]
+        citation_validator=CitationValidator(max_sources=2),
+        market_intel_service=DummyMarketIntel(),  # type: ignore[arg-type]
+    )
+
+    async def collect() -> list:
+        return [
+            event
+            async for event in service.ask_stream(
+                question="Какие меры безопасности?",
+                query_type=QueryType.technical,
+            )
+        ]
+
+    events = asyncio.run(collect())
+
+    assert events[:3] == ["Система поддерживает ", "RBAC ", "и аудит."]
+    final = events[-1]
+    assert isinstance(final, AskResponse)
+    assert "Система поддерживает RBAC и аудит." in final.answer
+    assert "Источники:" in final.answer
+
+
+class CountingClient:
+    """LLM client stub that counts generation calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, **kwargs) -> LLMResult:
+        self.calls += 1
+        return LLMResult(answer=f"answer {self.calls}")
+
+
+def test_response_cache_reuses_answer_per_mode() -> None:
+    llm = LLMService(
+        provider="api",
+        model_name="test",
+        timeout_sec=1,
+        temperature=0.0,
+        max_tokens=64,
+        api_key="test",
+        response_cache=ResponseCache(),
+    )
+    client = CountingClient()
+    llm._client = client  # type: ignore[assignment]
+
+    async def ask(question: str, mode: AnswerMode) -> str:
+        result = await llm.answer(question, QueryType.technical, "context", response_mode=mode)
+        return result.answer
+
+    first = asyncio.run(ask("Какие меры  безопасности?", AnswerMode.standard))
+    repeated = asyncio.run(ask("Какие меры безопасности?", AnswerMode.standard))
+    brief = asyncio.run(ask("Какие меры безопасности?", AnswerMode.brief))
+
+    assert first == repeated == "answer 1"
+    assert brief == "answer 2"
+    assert client.calls == 2
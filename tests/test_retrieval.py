@@ -3,6 +3,7 @@
 import asyncio
 
 from app.models.schemas import SearchHit
+from app.rag.embeddings import QueryEmbeddingBatcher
 from app.rag.retriever import Retriever
 
 
@@ -13,6 +14,20 @@ class FakeEmbeddingService:
         assert texts
         return [[0.1, 0.2, 0.3]]
 
+    async def aembed_texts(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_texts(texts)
+
+
+class RecordingEmbeddingService:
+    """Fake embedding service that records each batch it receives."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def aembed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
 
 class FakeQdrantService:
     """Simple fake qdrant service."""
@@ -101,6 +116,32 @@ class FakeQdrantWithDocumentScope:
         ]
 
 
+class FakeQdrantOutdatedVersion:
+    """Has no chunks for the requested version; only unversioned search hits."""
+
+    def __init__(self) -> None:
+        self.versions: list[str | None] = []
+
+    async def search(
+        self,
+        query_vector: list[float],
+        top_k: int,
+        version: str | None = None,
+        document_names: list[str] | None = None,
+    ) -> list[SearchHit]:
+        self.versions.append(version)
+        if version is not None:
+            return []
+        return [
+            SearchHit(
+                id="latest",
+                score=0.8,
+                text="latest text",
+                metadata={"document_name": "doc1", "version": "v2"},
+            )
+        ]
+
+
 def test_retrieval_applies_similarity_threshold() -> None:
     retriever = Retriever(
         embedding_service=FakeEmbeddingService(),  # type: ignore[arg-type]
@@ -154,3 +195,50 @@ def test_retrieval_passes_document_scope_to_qdrant() -> None:
     assert result.hits
     assert result.hits[0].id == "scoped"
     assert qdrant.last_document_names == ["scope.docx"]
+
+
+def test_query_batcher_coalesces_concurrent_queries() -> None:
+    embedding_service = RecordingEmbeddingService()
+    batcher = QueryEmbeddingBatcher(embedding_service, max_batch=8, max_wait_ms=5)  # type: ignore[arg-type]
+
+    async def run() -> list[list[float]]:
+        return await asyncio.gather(*(batcher.submit("q" * size) for size in (1, 2, 3)))
+
+    vectors = asyncio.run(run())
+
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert embedding_service.batches == [["q", "qq", "qqq"]]
+
+
+def test_query_batcher_aclose_cancels_worker_and_waiters() -> None:
+    batcher = QueryEmbeddingBatcher(RecordingEmbeddingService(), max_wait_ms=1000)  # type: ignore[arg-type]
+
+    async def run() -> tuple[bool, bool]:
+        waiter = asyncio.create_task(batcher.submit("q"))
+        queued = asyncio.create_task(batcher.submit("qq"))
+        await asyncio.sleep(0.01)
+        worker = batcher._worker
+        await batcher.aclose()
+        await asyncio.gather(waiter, queued, return_exceptions=True)
+        return worker is not None and worker.cancelled(), waiter.cancelled() and queued.cancelled()
+
+    worker_cancelled, waiters_cancelled = asyncio.run(run())
+
+    assert worker_cancelled
+    assert waiters_cancelled
+
+
+def test_retrieval_speculative_fallback_uses_unversioned_hits() -> None:
+    qdrant = FakeQdrantOutdatedVersion()
+    retriever = Retriever(
+        embedding_service=FakeEmbeddingService(),  # type: ignore[arg-type]
+        qdrant_service=qdrant,  # type: ignore[arg-type]
+        top_k=3,
+        similarity_threshold=0.2,
+        speculative_fallback=True,
+    )
+
+    result = asyncio.run(retriever.retrieve(question="latest text", version="v1"))
+
+    assert [hit.id for hit in result.hits] == ["latest"]
+    assert qdrant.versions == ["v1", None]